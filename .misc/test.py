@@ -5,15 +5,15 @@ Edit the two paths below, then run:
   python xlsx_to_customers_json.py
 
 Requirements:
-  python -m pip install openpyxl
+  python -m pip install openpyxl orjson
 """
 
-import json
-from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from itertools import islice
+from typing import Any, Dict, Iterator, List, NamedTuple, Tuple
 
 import openpyxl
+import orjson
 
 
 # ----------------------------
@@ -22,10 +22,20 @@ import openpyxl
 INPUT_XLSX_PATH = Path(r"CustomerDB.xlsx")   # <-- change this
 OUTPUT_JSON_PATH = Path(r"../assets/customers1.json")  # <-- change this
 SHEET_NAME = None  # e.g. "Sheet1" or leave None to use the active sheet
+STREAM_ROW_THRESHOLD = 10_000  # above this many rows, write customers one at a time
 # ----------------------------
 
 
 EXPECTED_HEADERS = ["Customer Name", "Customer ID", "Role", "Username"]
+EXPECTED_SET = frozenset(EXPECTED_HEADERS)
+
+
+class ColIdx(NamedTuple):
+    """0-based column positions of the expected headers (same order as EXPECTED_HEADERS)."""
+    name: int
+    id: int
+    role: int
+    username: int
 
 
 def normalize_cell(v: Any) -> str:
@@ -34,50 +44,68 @@ def normalize_cell(v: Any) -> str:
     return str(v).strip()
 
 
-def find_header_row(ws) -> Tuple[int, Dict[str, int]]:
+def find_header_row(rows: Iterator[Tuple[Any, ...]]) -> Tuple[int, ColIdx]:
     """
     Find the row containing the expected headers.
+    Consumes `rows` (a values_only iter_rows iterator) up to and including the header,
+    so the same iterator can be handed straight to read_rows afterwards.
     Returns:
-      header_row_index_1_based, mapping header->column_index_0_based
+      header_row_index_1_based, ColIdx of 0-based column positions
     """
-    for r in range(1, min(ws.max_row, 50) + 1):
-        values = [normalize_cell(c.value) for c in ws[r]]
-        if not any(values):
+    for r, row in enumerate(islice(rows, 50), start=1):
+        values = tuple(normalize_cell(v) for v in row)
+        # cheap membership test first; only the real header row pays for the mapping
+        if not EXPECTED_SET.issubset(values):
             continue
 
         mapping = {v: idx for idx, v in enumerate(values) if v}
-        if all(h in mapping for h in EXPECTED_HEADERS):
-            return r, {h: mapping[h] for h in EXPECTED_HEADERS}
+        return r, ColIdx(*(mapping[h] for h in EXPECTED_HEADERS))
 
     raise ValueError(f"Header row not found. Expected headers: {EXPECTED_HEADERS}")
 
 
-def read_rows(ws, header_row: int, col_map: Dict[str, int]) -> List[Tuple[str, int, str, str]]:
+def _raise_missing(r: int, name: str, id_: Any, role: str, user: str) -> None:
+    # cold path kept out of read_rows so the loop body stays small
+    raise ValueError(
+        f"Row {r} missing required fields: "
+        f"Customer Name={name!r}, Customer ID={id_!r}, Role={role!r}, Username={user!r}"
+    )
+
+
+def read_rows(rows: Iterator[Tuple[Any, ...]], header_row: int, cols: ColIdx) -> List[Tuple[str, int, str, str]]:
     out: List[Tuple[str, int, str, str]] = []
 
-    for r in range(header_row + 1, ws.max_row + 1):
-        row_cells = ws[r]
+    # unpack column positions into locals once instead of per-row lookups
+    name_i, id_i, role_i, user_i = cols
 
-        cust_name = normalize_cell(row_cells[col_map["Customer Name"]].value)
-        cust_id_raw = row_cells[col_map["Customer ID"]].value
-        role = normalize_cell(row_cells[col_map["Role"]].value)
-        username = normalize_cell(row_cells[col_map["Username"]].value)
+    _str = str  # local alias: LOAD_FAST instead of a builtins lookup per cell
+
+    for r, row in enumerate(rows, start=header_row + 1):
+        # normalize_cell inlined: this loop runs once per sheet row
+        cust_name = "" if (v := row[name_i]) is None else _str(v).strip()
+        cust_id_raw = row[id_i]
+        role = "" if (v := row[role_i]) is None else _str(v).strip()
+        username = "" if (v := row[user_i]) is None else _str(v).strip()
 
         # skip totally blank rows
         if not (cust_name or cust_id_raw or role or username):
             continue
 
         # basic validation
-        if cust_name == "" or role == "" or username == "" or cust_id_raw in (None, ""):
-            raise ValueError(
-                f"Row {r} missing required fields: "
-                f"Customer Name={cust_name!r}, Customer ID={cust_id_raw!r}, Role={role!r}, Username={username!r}"
-            )
-
-        try:
-            cust_id = int(str(cust_id_raw).strip())
-        except Exception as e:
-            raise ValueError(f"Row {r} has non-integer Customer ID: {cust_id_raw!r}") from e
+        if not (cust_name and role and username and cust_id_raw is not None and cust_id_raw != ""):
+            _raise_missing(r, cust_name, cust_id_raw, role, username)
+
+        # values_only hands back numeric cells as int/float already; only parse text
+        id_type = type(cust_id_raw)
+        if id_type is int:
+            cust_id = cust_id_raw
+        elif id_type is float and cust_id_raw.is_integer():
+            cust_id = int(cust_id_raw)
+        else:
+            try:
+                cust_id = int(_str(cust_id_raw).strip())
+            except Exception as e:
+                raise ValueError(f"Row {r} has non-integer Customer ID: {cust_id_raw!r}") from e
 
         out.append((cust_name, cust_id, role, username))
 
@@ -89,58 +117,79 @@ def build_customers_json(rows: List[Tuple[str, int, str, str]]) -> Dict[str, Any
     Groups rows by customer_id.
     If duplicate (customer_id, role) appears, last one wins.
     """
-    customers_by_id: Dict[int, Dict[str, Any]] = OrderedDict()
+    # plain dicts keep insertion order, so customers come out in first-seen order
+    customers_by_id: Dict[int, Dict[str, Any]] = {}
+    accounts_by_key: Dict[Tuple[int, str], Dict[str, str]] = {}  # dedupe table
 
     for cust_name, cust_id, role, username in rows:
-        if cust_id not in customers_by_id:
-            customers_by_id[cust_id] = {
+        cust = customers_by_id.get(cust_id)
+        if cust is None:
+            cust = customers_by_id[cust_id] = {
                 "id": cust_id,
                 "name": cust_name,
                 "accounts": [],
-                "_role_index": {},  # helper map for dedupe
             }
-
-        cust = customers_by_id[cust_id]
-
-        if cust["name"] != cust_name:
+        elif cust["name"] != cust_name:
             print(
                 f"Warning: Customer ID {cust_id} has multiple names: "
                 f"{cust['name']!r} vs {cust_name!r}. Keeping {cust['name']!r}."
             )
 
-        role_index: Dict[str, int] = cust["_role_index"]
-        account = {"role": role, "username": username}
-
-        if role in role_index:
-            cust["accounts"][role_index[role]] = account
+        key = (cust_id, role)
+        account = accounts_by_key.get(key)
+        if account is not None:
+            account["username"] = username
         else:
-            role_index[role] = len(cust["accounts"])
+            account = accounts_by_key[key] = {"role": role, "username": username}
             cust["accounts"].append(account)
 
-    customers: List[Dict[str, Any]] = []
-    for cust in customers_by_id.values():
-        cust.pop("_role_index", None)
-        customers.append(cust)
+    return {"version": 1, "customers": list(customers_by_id.values())}
+
 
-    return {"version": 1, "customers": customers}
+def write_customers_json(f, payload: Dict[str, Any], stream: bool) -> None:
+    """
+    Write payload to the binary file f.
+    stream=False: one indented orjson dump (small sheets, diff-friendly output).
+    stream=True: compact output, one customer serialized at a time so the encoder
+    never holds the whole document in its buffer.
+    """
+    if not stream:
+        f.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+        return
+
+    f.write(b'{"version":%d,"customers":[' % payload["version"])
+    for i, cust in enumerate(payload["customers"]):
+        if i:
+            f.write(b",")
+        f.write(orjson.dumps(cust))
+    f.write(b"]}")
 
 
 def main():
     if not INPUT_XLSX_PATH.exists():
         raise FileNotFoundError(f"Input XLSX not found: {INPUT_XLSX_PATH}")
 
-    wb = openpyxl.load_workbook(INPUT_XLSX_PATH, data_only=True)
-    ws = wb[SHEET_NAME] if SHEET_NAME else wb.active
+    # read_only streams rows instead of building the full cell grid in memory
+    wb = openpyxl.load_workbook(INPUT_XLSX_PATH, data_only=True, read_only=True)
+    try:
+        ws = wb[SHEET_NAME] if SHEET_NAME else wb.active
+        sheet_title = ws.title
+
+        # one pass: header detection and row reading share the same iterator
+        row_iter = ws.iter_rows(values_only=True)
+        header_row, cols = find_header_row(row_iter)
+        rows = read_rows(row_iter, header_row, cols)
+    finally:
+        wb.close()
 
-    header_row, col_map = find_header_row(ws)
-    rows = read_rows(ws, header_row, col_map)
     payload = build_customers_json(rows)
 
     OUTPUT_JSON_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with open(OUTPUT_JSON_PATH, "w", encoding="utf-8") as f:
-        json.dump(payload, f, indent=2, ensure_ascii=False)
+    # orjson emits UTF-8 bytes directly (no ensure_ascii needed)
+    with open(OUTPUT_JSON_PATH, "wb") as f:
+        write_customers_json(f, payload, stream=len(rows) > STREAM_ROW_THRESHOLD)
 
-    print(f"Sheet: {ws.title}")
+    print(f"Sheet: {sheet_title}")
     print(f"Rows converted: {len(rows)}")
     print(f"Customers created: {len(payload['customers'])}")
     print(f"Wrote JSON to: {OUTPUT_JSON_PATH.resolve()}")
@@ -1,17 +1,53 @@
+import hashlib
+import logging
 import os
 from dataclasses import dataclass
+from functools import cached_property, lru_cache, partialmethod
 from typing import Any
 import shutil
 import subprocess
 from pathlib import Path
 
+import queue
 import sys
+import threading
+import time
+import uuid
 
 from config.rtvsdb import RTVSDB
 from core.config import Config
 
+_logger = logging.getLogger(__name__)
 
-@dataclass
+# Per-process log metadata: neither changes for the life of a test process
+# (xdist workers and lanes are separate interpreters, not forks).
+_PID = os.getpid()
+_WORKER = os.getenv("PYTEST_XDIST_WORKER", "local")
+
+# test_logs are written by a background thread in small batches. Terminal
+# entries flush the queue so the controller sees a finished test right away.
+_LOG_QUEUE_SIZE = 10_000
+_LOG_BATCH_SIZE = 128
+_LOG_FLUSH_INTERVAL_S = 0.1
+_FLUSH_LOG_TYPES = frozenset({"end", "error", "force_skip"})
+
+# Only Chrome has managed profiles. Defaults use this exact object, so the
+# common call is an identity check rather than a lowered copy of the name.
+_CHROME = "chrome"
+
+
+def _is_chrome(browser_name: str) -> bool:
+    return browser_name is _CHROME or browser_name.casefold() == _CHROME
+
+
+# Message used when an add_log_* helper is called without one
+_DEFAULT_LOG_MESSAGES = {"start": "Test started", "end": "Test finished", "heartbeat": "heartbeat"}
+
+# driver.current_url is a WebDriver HTTP round-trip; reuse it for a burst of logs
+_URL_CACHE_TTL_S = 0.5
+
+
+@dataclass(slots=True)
 class RunConfiguration:
     prefix: str = "RTVS"
     run_id: str | None = None
@@ -37,7 +73,7 @@ class RunConfiguration:
     user_roles: str | None = None
     user_role: str | None = None
     user_name: str | None = None
-    pid: str | None = None
+    pid: int | None = None
     worker: str | None = None
     workbook_title: str | None = None
     other_info: dict | None = None
@@ -50,11 +86,25 @@ class ConfigAssists:
 
     BROWSER = Config.get_browser()
     ENV = Config.get_test_env()
+    # Log types written to test_logs, e.g. RTVS_LOG_TYPES=start,end,error,test_case,force_skip to drop heartbeats
+    _ENABLED_TYPES = frozenset(
+        t.strip() for t in
+        os.getenv("RTVS_LOG_TYPES", "start,end,error,test_case,update,force_skip,heartbeat").split(",")
+    )
 
     def __init__(self):
-        self.db = RTVSDB()
         self.run_config: RunConfiguration | None = None
         self.set_run_configuration(RunConfiguration())
+        self._log_queue: queue.Queue = queue.Queue(maxsize=_LOG_QUEUE_SIZE)
+        self._log_thread: threading.Thread | None = None
+        self._log_error: Exception | None = None
+        self._role_cache: dict[str, dict] = {}
+
+    @cached_property
+    def db(self) -> RTVSDB:
+        # Opened on first DB access, so run-id-only flows never touch SQLite.
+        # One long-lived connection per ConfigAssists; the log writer thread opens its own.
+        return RTVSDB()
 
     def create_first_time_setup(
         self,
@@ -65,57 +115,73 @@ class ConfigAssists:
         tester_signature: str | None = None,
     ):
         self.install_requirements()
-        # Create the chrome_profiles table if it doesn't exist
-        self.db.create_chrome_profile_info_table()
-        # Initialize the table with default profiles
-        self.db.initialize_chrome_profiles(profile_count=10)
-        self.db.create_customer_tables()
-        self.db.load_customer_json_into_db()
-        self.db.create_run_and_log_tables()
-        self.db.load_test_packages_from_dict()
-        self.db.create_tester_info_table()
-        if (
-            tester_username
-            and tester_password
-            and tester_email
-            and tester_reason_for_login
-            and tester_signature
-        ):
-            # Clear existing records first
-            self.db.clear_tester_info_table()
-            # Insert new tester info
-            self.db.insert_tester_info(
-                tester_username,
-                tester_password,
-                tester_email,
-                tester_reason_for_login,
-                tester_signature,
-            )
-
+        # All schema/seed writes share one transaction (single commit)
+        with self.db.transaction():
+            # Create the chrome_profiles table if it doesn't exist
+            self.db.create_chrome_profile_info_table()
+            # Initialize the table with default profiles
+            self.db.initialize_chrome_profiles(profile_count=10)
+            self.db.create_customer_tables()
+            self.db.load_customer_json_into_db()
+            self.db.create_run_and_log_tables()
+            self.db.load_test_packages_from_dict()
+            self.db.create_tester_info_table()
+            if (
+                tester_username
+                and tester_password
+                and tester_email
+                and tester_reason_for_login
+                and tester_signature
+            ):
+                # Clear existing records first
+                self.db.clear_tester_info_table()
+                # Insert new tester info
+                self.db.insert_tester_info(
+                    tester_username,
+                    tester_password,
+                    tester_email,
+                    tester_reason_for_login,
+                    tester_signature,
+                )
+        # customer accounts were reloaded
+        self._role_cache.clear()
 
 
     def install_requirements(self) -> list[str]:
-        prefix = self._pick_external_python_for_setup()
+        # copy: the cached list is shared between calls
+        prefix = list(self._pick_external_python_for_setup())
         req = self._bundled_requirements_path()
 
-        # make sure pip exists
+        # Skip pip entirely when this interpreter already installed this exact requirements.txt
+        deps_hash = hashlib.sha256(req.read_bytes() + "\0".join(prefix).encode()).hexdigest()
+        sentinel = Config.RTVS_DEFAULT_DB_PATH.parent / ".rtvs_deps_ok"
         try:
-            subprocess.run(prefix + ["-m", "pip", "--version"], check=True, capture_output=True, text=True)
-        except Exception:
-            subprocess.run(prefix + ["-m", "ensurepip", "--upgrade"], check=True)
+            if sentinel.read_text(encoding="utf-8").strip() == deps_hash:
+                return prefix
+        except OSError:
+            pass
+
+        pip_install = prefix + ["-m", "pip", "install", "--disable-pip-version-check", "--no-input"]
 
-        # install deps (try normal, then --user fallback)
+        # install deps (try normal, then bootstrap pip and --user fallback)
         try:
-            subprocess.run(prefix + ["-m", "pip", "install", "-r", str(req)], check=True)
+            subprocess.run(pip_install + ["-r", str(req)], check=True)
         except subprocess.CalledProcessError:
-            subprocess.run(prefix + ["-m", "pip", "install", "--user", "-r", str(req)], check=True)
+            subprocess.run(prefix + ["-m", "ensurepip", "--upgrade"], check=False)
+            subprocess.run(pip_install + ["--user", "-r", str(req)], check=True)
 
         # quick sanity check
         subprocess.run(prefix + ["-c", "import pytest; import selenium; import PySide6"], check=True)
 
+        try:
+            sentinel.parent.mkdir(parents=True, exist_ok=True)
+            sentinel.write_text(deps_hash, encoding="utf-8")
+        except OSError:
+            pass  # deps are installed; without the sentinel the next run just re-checks with pip
         return prefix
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def _pick_external_python_for_setup() -> list[str]:
         py = os.getenv("RTVS_PYTHON")
         if py and Path(py).exists():
@@ -132,6 +198,7 @@ class ConfigAssists:
         raise RuntimeError("Python not found. Install Python or set RTVS_PYTHON.")
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def _bundled_requirements_path() -> Path:
         # PyInstaller onefile extracts to sys._MEIPASS
         if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):
@@ -154,88 +221,87 @@ class ConfigAssists:
 
     # Run configuration interactors
     def set_run_configuration(self, run_config: RunConfiguration):
-        # Set the current run configuration
+        # Set the current run configuration; pid/worker are fixed per process, so stamp them once here
+        if run_config.pid is None:
+            run_config.pid = _PID
+        if not run_config.worker:
+            run_config.worker = _WORKER
         self.run_config = run_config
 
     def get_run_configuration(self):
         # Get the current run configuration
         return self.run_config
 
+    def update_run_configuration(self, **fields):
+        # Set several run configuration fields in one call, e.g. update_run_configuration(env=..., browser=...)
+        if not self.run_config:
+            return
+        known = RunConfiguration.__dataclass_fields__
+        for name, value in fields.items():
+            if name not in known:
+                raise AttributeError(f"RunConfiguration has no field {name!r}")
+            setattr(self.run_config, name, value)
+
     def set_env(self, env: str):
-        if self.run_config:
-            self.run_config.env = env
+        self.update_run_configuration(env=env)
     def set_category(self, category: str):
-        if self.run_config:
-            self.run_config.category = category
+        self.update_run_configuration(category=category)
     def set_test_package(self, test_package: str):
-        if self.run_config:
-            self.run_config.test_package = test_package
+        self.update_run_configuration(test_package=test_package)
     def set_test_name(self, test_name: str):
-        if self.run_config:
-            self.run_config.test_name = test_name
+        self.update_run_configuration(test_name=test_name)
     def set_browser(self, browser: str):
-        if self.run_config:
-            self.run_config.browser = browser
+        self.update_run_configuration(browser=browser)
     def set_client_id(self, client_id: int):
-        if self.run_config:
-            self.run_config.client_id = client_id
+        self.update_run_configuration(client_id=client_id)
     def set_timestamp(self, timestamp: str):
-        if self.run_config:
-            self.run_config.timestamp = timestamp
+        self.update_run_configuration(timestamp=timestamp)
     def set_unique_id(self):
         if self.run_config:
-            import uuid
-            self.run_config.unique_id = str(uuid.uuid4())
+            self.run_config.unique_id = uuid.uuid4().hex
     def set_prefix(self, prefix: str):
-        if self.run_config:
-            self.run_config.prefix = prefix
+        self.update_run_configuration(prefix=prefix)
     def set_multiprocessing(self, multiprocessing: bool):
-        if self.run_config:
-            self.run_config.multiprocessing = multiprocessing
+        self.update_run_configuration(multiprocessing=multiprocessing)
     def set_threads(self, threads: int):
-        if self.run_config:
-            self.run_config.threads = threads
+        self.update_run_configuration(threads=threads)
 
     def create_run_id(self):
-        if self.run_config:
-            parts = [
-                self.run_config.prefix,
-                self.run_config.category or "CAT",
-                self.run_config.env or "ENV",
-                self.run_config.test_package or "PKG",
-                self.run_config.started_at or "TIME",
-                self.run_config.unique_id or "UID"
-            ]
-            self.run_config.run_id = "_".join(parts)
-            return self.run_config.run_id
+        rc = self.run_config
+        if rc:
+            rc.run_id = (
+                f"{rc.prefix}_{rc.category or 'CAT'}_{rc.env or 'ENV'}_"
+                f"{rc.test_package or 'PKG'}_{rc.started_at or 'TIME'}_{rc.unique_id or 'UID'}"
+            )
+            return rc.run_id
         return None
 
 
     # Chrome profile interactors
-    def display_profiles(self, browser_name='chrome'):
+    def display_profiles(self, browser_name=_CHROME):
         # Display current chrome profiles
-        if browser_name.lower() == 'chrome':
+        if _is_chrome(browser_name):
             self.db.display_chrome_profiles()
 
-    def update_profile_mfa_time(self, profile_name, browser_name='chrome'):
+    def update_profile_mfa_time(self, profile_name, browser_name=_CHROME):
         # Update the MFA time for a given profile
-        if browser_name.lower() == 'chrome':
+        if _is_chrome(browser_name):
             print(f"Updating MFA time for profile {profile_name}.")
             self.db.edit_chrome_profile_table(change_type='UPDATE_MFA_TIME', profile_name=profile_name)
 
-    def set_profile_active(self, profile_name, browser_name='chrome'):
+    def set_profile_active(self, profile_name, browser_name=_CHROME):
         # Set a given profile as active
-        if browser_name.lower() == 'chrome':
+        if _is_chrome(browser_name):
             print(f"Setting profile {profile_name} as active.")
             self.db.edit_chrome_profile_table(change_type='SET_ACTIVE_PROFILE', profile_name=profile_name)
 
-    def set_profile_inactive(self, profile_name, browser_name='chrome'):
+    def set_profile_inactive(self, profile_name, browser_name=_CHROME):
         # Set a given profile as inactive
-        if browser_name.lower() == 'chrome':
+        if _is_chrome(browser_name):
             print(f"Setting profile {profile_name} as inactive.")
             self.db.edit_chrome_profile_table(change_type='SET_INACTIVE_PROFILE', profile_name=profile_name)
 
-    # def fetch_first_inactive_profile(self, browser_name='chrome'):
+    # def fetch_first_inactive_profile(self, browser_name=_CHROME):
     #     # Fetch and return inactive profiles
     #     if browser_name.lower() == 'chrome':
     #         rows = self.db.get_inactive_chrome_profiles()
@@ -246,23 +312,35 @@ class ConfigAssists:
     #         return inactive_profile
     #     return None
 
-    def fetch_first_inactive_profile(self, browser_name: str = "chrome", run_id: str | None = None):
-        if browser_name.lower() != "chrome":
+    def fetch_first_inactive_profile(self, browser_name: str = _CHROME, run_id: str | None = None):
+        if not _is_chrome(browser_name):
             return None
 
-        tag = run_id or "no_run_id"
-        claimed_by = f"{tag}|pid={os.getpid()}"
+        return self.db.claim_first_inactive_chrome_profile(claimed_by=self.profile_claim_tag(run_id))
 
-        return self.db.claim_first_inactive_chrome_profile(claimed_by=claimed_by)
+    @staticmethod
+    def profile_claim_tag(run_id: str | None = None) -> str:
+        # Stored in chrome_profiles.currently_running to show who holds a profile
+        return f"{run_id or 'no_run_id'}|pid={_PID}"
 
     # Customer table interactors
     def get_role_dict_for_customer_id(self, customer_id: int) -> dict:
-        # Get role dictionary for a given customer ID
-        return self.db.get_role_dict_for_customer_id(customer_id)
+        # Get role dictionary for a given customer ID (cached; ids may arrive as int or str)
+        key = str(customer_id)
+        roles = self._role_cache.get(key)
+        if roles is None:
+            roles = self._role_cache[key] = self.db.get_role_dict_for_customer_id(customer_id)
+        return dict(roles)
 
     def update_username_for_role(self, customer_id: int, role: str, new_username: str):
         # Update username for a specific role under a customer ID
         self.db.update_username_for_role(customer_id, role, new_username)
+        self._role_cache.pop(str(customer_id), None)
+
+    def update_usernames_for_roles(self, customer_id: int, role_usernames: list[tuple[str, str]]):
+        # Update several (role, username) pairs under a customer ID in one transaction
+        self.db.update_usernames_for_roles(customer_id, role_usernames)
+        self._role_cache.pop(str(customer_id), None)
 
     # Test_log interactors and run_id stuff
 
@@ -305,88 +383,121 @@ class ConfigAssists:
     def _safe_current_url(self, driver) -> str | None:
         if driver is None:
             return None
+        now = time.monotonic()
+        cached = getattr(driver, "_rtvs_url_cache", None)
+        if cached is not None and now - cached[1] < _URL_CACHE_TTL_S:
+            return cached[0]
         try:
-            return driver.current_url
+            url = driver.current_url
         except Exception:
-            return None
-
-    def _get_worker(self) -> str:
-        return os.getenv("PYTEST_XDIST_WORKER", "local")
-
-    def _get_pid(self) -> int:
+            # Cache the failure too, so a dead session isn't re-queried for every log in the burst
+            url = None
         try:
-            return int(os.getpid())
+            driver._rtvs_url_cache = (url, now)
         except Exception:
-            return -1
+            pass
+        return url
 
-    def _log(self, *, type_: str, message: str, status: str = "Info", driver=None, current_url: str | None = None, test_name: str | None = None, extra: dict[str, Any] | None = None, mark_fail: bool = False, time_taken_ms: int | str = 'x', comment: str | None = None, test_case_id: str | None = None) -> None:
-        rc = self._require_rc()
+    def _log(self, message: str | None = None, *, type_: str, status: str = "Info", driver=None, current_url: str | None = None, test_name: str | None = None, mark_fail: bool = False, time_taken_ms: int | str = 'x', comment: str | None = None, test_case_id: str | None = None) -> None:
+        if message is None:
+            message = _DEFAULT_LOG_MESSAGES.get(type_, "")
+
+        if type_ not in self._ENABLED_TYPES:
+            # Filtered out: skip the driver/DB work, but an error still fails the run
+            if mark_fail:
+                self.db.mark_test_failure(self._require_rc().run_id, message=message)
+            return
+
+        # Hot path: one truthiness check; _require_rc only runs to raise the specific error
+        rc = self.run_config
+        if not (rc and rc.run_id):
+            rc = self._require_rc()
 
         # Allow caller override, else use driver, else None
         url = current_url if current_url is not None else self._safe_current_url(driver)
 
         # Pick test name: explicit > rc.test_name
         tn = test_name or rc.test_name
+        run_id = rc.run_id
 
-        # Worker/pid defaults if not already set
-        worker = rc.worker or self._get_worker()
-        pid = rc.pid if isinstance(rc.pid, int) else self._get_pid()
+        # tuple in TEST_LOG_COLUMNS order; each rc field is read exactly once
+        self._enqueue_log((
+            run_id, test_case_id, type_, rc.browser, rc.test_package, tn,
+            rc.client_id, rc.user_role, rc.user_name, rc.pid, rc.worker,
+            status, message, url, time_taken_ms, comment,
+        ))
 
-        # Browser/profile defaults
-        browser = rc.browser
-        profile = rc.browser_profile
-        if driver is not None and hasattr(driver, "_rtvs_profile"):
-            profile = profile or getattr(driver, "_rtvs_profile", None)
+        if type_ in _FLUSH_LOG_TYPES:
+            self.flush_logs()
 
-        # Optional: merge extras into other_info just for debugging
+        if mark_fail:
+            self.db.mark_test_failure(run_id, message=message)
+
+    def _enqueue_log(self, row: tuple) -> None:
+        if self._log_thread is None:
+            self._log_thread = threading.Thread(target=self._drain_logs, name="rtvs-log-writer", daemon=True)
+            self._log_thread.start()
+        # Blocks only if the writer is a full queue behind; writing the row inline
+        # instead would give it an id ahead of the rows still queued.
+        self._log_queue.put(row)
+
+    def _drain_logs(self) -> None:
+        # sqlite connections are bound to the thread that opened them
+        db = None
+        q = self._log_queue
+        while True:
+            rows = [q.get()]
+            deadline = time.monotonic() + _LOG_FLUSH_INTERVAL_S
+            while len(rows) < _LOG_BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    rows.append(q.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            try:
+                if db is None:
+                    db = RTVSDB()
+                db.insert_test_logs_many(rows)
+            except Exception as e:
+                _logger.exception("failed to write %d test log(s)", len(rows))
+                # Reopen next time in case the connection itself is broken; the
+                # test thread re-raises this from flush_logs()
+                db = None
+                self._log_error = e
+            finally:
+                for _ in rows:
+                    q.task_done()
+
+    def flush_logs(self) -> None:
+        """
+        Block until every queued test log has been written.
+        Raises the writer thread's error if a batch could not be written.
+        """
+        if self._log_thread is not None:
+            self._log_queue.join()
+        err, self._log_error = self._log_error, None
+        if err is not None:
+            raise RuntimeError("RTVS test log writer failed; some test_logs rows were not saved") from err
+
+    # test facing helpers: _log with the type (and per-type defaults) bound,
+    # so each call is one frame. message is positional, the rest keyword-only.
+    add_log_start = partialmethod(_log, type_="start")
+    add_log_test_case = partialmethod(_log, type_="test_case", test_case_id="N/A")
+    add_log_update = partialmethod(_log, type_="update", status="Success")
+    add_log_end = partialmethod(_log, type_="end", status="Success")
+    add_log_skip = partialmethod(_log, type_="force_skip", status="Skipped")
+    add_log_error = partialmethod(_log, type_="error", status="Error", mark_fail=True)
+    add_log_heartbeat = partialmethod(_log, type_="heartbeat")
+
+    def add_log_debug(self, message: str, *, extra: dict[str, Any] | None = None, driver=None, status: str = "Info") -> None:
+        # Opt-in: merge extras into other_info just for debugging, then log as an update
         if extra:
+            rc = self._require_rc()
             rc.other_info = rc.other_info or {}
             rc.other_info.update(extra)
-
-        self.db.insert_test_log(
-            run_id=rc.run_id,
-            test_case_id=test_case_id,
-            type_=type_,
-            status=status,
-            message=message,
-            browser=browser,
-            test_package=rc.test_package,
-            test_name=tn,
-            client_id=rc.client_id,
-            user_role=rc.user_role,
-            user_name=rc.user_name,
-            pid=pid,
-            worker=worker,
-            current_url=url,
-            time_taken_ms=time_taken_ms,
-            comment=comment
-        )
-
-        if mark_fail:
-            self.db.mark_test_failure(rc.run_id, message=message)
-
-    # test facing helpers
-    def add_log_start(self, message: str = "Test started", *, driver=None, status: str = "Info") -> None:
-        self._log(type_="start", message=message, status=status, driver=driver)
-
-    def add_log_test_case(self, message: str, *, driver=None, status: str = "Info", time_taken_ms="x", comment=None, test_case_id="N/A") -> None:
-        self._log(type_="test_case", test_case_id=test_case_id, message=message, status=status, driver=driver, time_taken_ms=time_taken_ms, comment=comment)
-
-    def add_log_update(self, message: str, *, driver=None, status: str = "Success",
-                     current_url: str | None = None) -> None:
-        self._log(type_="update", message=message, status=status, driver=driver, current_url=current_url)
-
-    def add_log_end(self, message: str = "Test finished", *, driver=None, status: str = "Success") -> None:
-        self._log(type_="end", message=message, status=status, driver=driver)
-
-    def add_log_skip(self, message: str, *, driver=None, status: str = "Skipped") -> None:
-        self._log(type_="force_skip", message=message, status=status, driver=driver)
-
-    def add_log_error(self, message: str, *, driver=None, status: str = "Error") -> None:
-        self._log(type_="error", message=message, status=status, driver=driver, mark_fail=True)
-
-    def add_log_heartbeat(self, message: str = "heartbeat", *, status="Info", driver=None) -> None:
-        self._log(type_="heartbeat", message=message, status=status, driver=driver)
+        self._log(message, type_="update", status=status, driver=driver)
 
 
 
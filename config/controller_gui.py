@@ -7,12 +7,12 @@ from openpyxl.styles import Font
 import os
 import subprocess
 import sys
-import time
+import threading
 import traceback
-from dataclasses import dataclass
+from itertools import groupby, islice
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import NamedTuple, Optional
 
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QPixmap
@@ -20,10 +20,87 @@ from PySide6.QtWidgets import QSplashScreen
 from PySide6 import QtCore, QtGui, QtWidgets
 
 from config.rtvsdb import RTVSDB  # type: ignore
-from config.config_assists import ConfigAssists  # type: ignore
+from config.config_assists import ConfigAssists, RunConfiguration  # type: ignore
 from core.rtvs_runner import build_lanes, print_plan, run_lanes_parallel, _pick_external_python
 from core.config import Config
 
+# QListWidgetItem's default flags plus a checkbox; built once for the start dialog lists
+CHECKABLE_FLAGS = (
+    QtCore.Qt.ItemFlag.ItemIsSelectable
+    | QtCore.Qt.ItemFlag.ItemIsEnabled
+    | QtCore.Qt.ItemFlag.ItemIsDragEnabled
+    | QtCore.Qt.ItemFlag.ItemIsUserCheckable
+)
+# Rows added to a check list per event-loop turn
+CHECK_LIST_CHUNK = 1000
+RUNS_PAGE_SIZE = 50  # test_runs rows fetched per scroll page
+LOGS_WINDOW = 200  # newest test_logs rows shown for the selected run
+_BAD_STATUSES = frozenset({"FAIL", "ERR"})  # runs shown in bold
+
+# Qt enums used on per-item / per-paint paths, resolved once
+_DISPLAY_ROLE = QtCore.Qt.ItemDataRole.DisplayRole
+_FONT_ROLE = QtCore.Qt.ItemDataRole.FontRole
+_USER_ROLE = QtCore.Qt.ItemDataRole.UserRole
+_CHECKED = QtCore.Qt.CheckState.Checked
+_UNCHECKED = QtCore.Qt.CheckState.Unchecked
+_KEEP_AR = QtCore.Qt.AspectRatioMode.KeepAspectRatio
+_SMOOTH = QtCore.Qt.TransformationMode.SmoothTransformation
+
+# Fixed statement text (LIMIT bound as a parameter) so each query hits sqlite3's statement cache
+_SELECT_PROFILES_SQL = """
+    SELECT id, profile_name, currently_running, is_active, COALESCE(last_mfa_time, '')
+    FROM chrome_profiles
+    ORDER BY id ASC;
+"""
+
+_SELECT_RUNS_SQL = """
+    SELECT
+        run_id, category, env, test_package, browsers,
+        COALESCE(clients,''), COALESCE(user_roles,''), threads, multiprocessing,
+        started_at, ended_at, status, failed_cases,
+        last_update_at, last_update_message
+    FROM test_runs
+    ORDER BY started_at DESC
+    LIMIT ? OFFSET ?;
+"""
+
+_COUNT_RUNS_SQL = "SELECT COUNT(*) FROM test_runs;"
+
+# Runs touched since the last refresh. >= because CURRENT_TIMESTAMP has one-second resolution;
+# unfinished runs are always included so their progress keeps showing.
+_SELECT_CHANGED_RUNS_SQL = """
+    SELECT
+        run_id, category, env, test_package, browsers,
+        COALESCE(clients,''), COALESCE(user_roles,''), threads, multiprocessing,
+        started_at, ended_at, status, failed_cases,
+        last_update_at, last_update_message
+    FROM test_runs
+    WHERE last_update_at >= ? OR ended_at IS NULL
+    ORDER BY started_at DESC;
+"""
+
+# Newest N log lines, returned oldest first (display order)
+_SELECT_RUN_LOGS_SQL = """
+    SELECT * FROM (
+        SELECT id, timestamp, type, status, test_name, message, worker, pid, current_url
+        FROM test_logs
+        WHERE run_id = ?
+        ORDER BY id DESC
+        LIMIT ?
+    ) ORDER BY id ASC;
+"""
+
+# Only the log lines written since the newest one on screen
+_SELECT_NEW_RUN_LOGS_SQL = """
+    SELECT * FROM (
+        SELECT id, timestamp, type, status, test_name, message, worker, pid, current_url
+        FROM test_logs
+        WHERE run_id = ? AND id > ?
+        ORDER BY id DESC
+        LIMIT ?
+    ) ORDER BY id ASC;
+"""
+
 
 def utc_to_local_display(utc_timestamp_str: str) -> str:
     """
@@ -53,16 +130,16 @@ def utc_to_local_display(utc_timestamp_str: str) -> str:
         return utc_timestamp_str
 
 
-@dataclass
-class ChromeProfileRow:
+# Row tuples in the column order of their SELECTs, so a cursor row maps straight onto _make
+class ChromeProfileRow(NamedTuple):
     id: int
     profile_name: str
     currently_running: str | None
     is_active: int
     last_mfa_time: str
 
-@dataclass
-class TestRunRow:
+
+class TestRunRow(NamedTuple):
     run_id: str
     category: str
     env: str
@@ -80,11 +157,11 @@ class TestRunRow:
     last_update_message: str | None
 
 
-@dataclass
-class TestLogRow:
+class TestLogRow(NamedTuple):
+    id: int
     timestamp: str
     type: str
-    status: str
+    status: str | None
     test_name: str | None
     message: str | None
     worker: str | None
@@ -92,14 +169,275 @@ class TestLogRow:
     current_url: str | None
 
 
-class TestRunWorker(QtCore.QThread):
+class _RowTableModel(QtCore.QAbstractTableModel):
+    """
+    Read-only table over a list of row records; cell text is formatted once per refresh.
+
+    set_rows() diffs against the current rows by _key(), so a refresh only repaints the
+    cells that changed and the view keeps its selection and scroll position.
+    Subclasses set HEADERS and define two staticmethods:
+      _key(row)    -> hashable identity of a row across refreshes
+      _format(row) -> tuple of cell strings, one per header
+    and may override _is_bold(row) to bold a row (default: never).
+    """
+
+    HEADERS: tuple[str, ...] = ()
+
+    def __init__(self, parent: QtCore.QObject | None = None):
+        super().__init__(parent)
+        self._rows: list = []
+        self._display: list[tuple[str, ...]] = []
+        self._bold = QtGui.QFont()
+        self._bold.setBold(True)
+
+    @staticmethod
+    def _is_bold(row) -> bool:
+        return False
+
+    def set_rows(self, rows: list) -> None:
+        key = self._key
+        new_keys = {key(r) for r in rows}
+        root = QtCore.QModelIndex()
+
+        if not any(key(r) in new_keys for r in self._rows):
+            # First load or a different data set altogether: one reset beats per-row signals
+            self.beginResetModel()
+            self._rows = list(rows)
+            self._display = [self._format(r) for r in rows]
+            self.endResetModel()
+            return
+
+        # Removals first, bottom-up so the remaining indexes stay valid
+        for i in range(len(self._rows) - 1, -1, -1):
+            if key(self._rows[i]) not in new_keys:
+                self.beginRemoveRows(root, i, i)
+                del self._rows[i]
+                del self._display[i]
+                self.endRemoveRows()
+
+        old_keys = {key(r) for r in self._rows}
+        if [key(r) for r in self._rows] != [key(r) for r in rows if key(r) in old_keys]:
+            # Surviving rows came back in a different order; not worth a move diff
+            self.beginResetModel()
+            self._rows = list(rows)
+            self._display = [self._format(r) for r in rows]
+            self.endResetModel()
+            return
+
+        for i, r in enumerate(rows):
+            if i < len(self._rows) and key(self._rows[i]) == key(r):
+                self._update_row(i, r)
+            else:
+                self._insert_row(i, r)
+
+    def _update_row(self, i: int, r) -> None:
+        """Replace row i, emitting dataChanged only for the cells whose text changed."""
+        text = self._format(r)
+        old_row, old = self._rows[i], self._display[i]
+        self._rows[i] = r
+        self._display[i] = text
+        if self._is_bold(old_row) != self._is_bold(r):
+            # Font role covers the whole row
+            self.dataChanged.emit(self.index(i, 0), self.index(i, len(self.HEADERS) - 1))
+            return
+        for col, (a, b) in enumerate(zip(old, text)):
+            if a != b:
+                idx = self.index(i, col)
+                self.dataChanged.emit(idx, idx)
+
+    def _insert_row(self, i: int, r) -> None:
+        self.beginInsertRows(QtCore.QModelIndex(), i, i)
+        self._rows.insert(i, r)
+        self._display.insert(i, self._format(r))
+        self.endInsertRows()
+
+    def row_at(self, row: int):
+        return self._rows[row]
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index: QtCore.QModelIndex, role: int = _DISPLAY_ROLE):
+        if not index.isValid():
+            return None
+        if role == _DISPLAY_ROLE:
+            return self._display[index.row()][index.column()]
+        if role == _FONT_ROLE and self._is_bold(self._rows[index.row()]):
+            return self._bold
+        return None
+
+    def headerData(self, section: int, orientation: QtCore.Qt.Orientation, role: int = _DISPLAY_ROLE):
+        if orientation == QtCore.Qt.Orientation.Horizontal and role == _DISPLAY_ROLE:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+
+class ProfilesModel(_RowTableModel):
+    """chrome_profiles rows, keyed by id."""
+
+    HEADERS = ("ID", "Profile", "Status", "Active", "Last MFA")
+
+    @staticmethod
+    def _key(p: ChromeProfileRow) -> int:
+        return p.id
+
+    @staticmethod
+    def _format(p: ChromeProfileRow) -> tuple[str, ...]:
+        return (
+            str(p.id),
+            p.profile_name,
+            "" if p.currently_running is None else p.currently_running,
+            str(p.is_active),
+            utc_to_local_display(p.last_mfa_time),
+        )
+
+    @staticmethod
+    def _is_bold(p: ChromeProfileRow) -> bool:
+        # simple visual cue for active
+        return p.is_active == 1
+
+
+class RunsTableModel(_RowTableModel):
+    """
+    test_runs rows, keyed by run_id and loaded a page at a time. The view calls fetchMore()
+    as it scrolls near the bottom; the model only asks `fetch_more(offset)` for the next
+    page and the window feeds the rows back through append_rows() once they arrive.
+    """
+
+    HEADERS = ("Run ID", "Status", "Failed", "Category", "Env", "Package", "Last Update", "Last Message")
+
+    def __init__(self, fetch_more, parent: QtCore.QObject | None = None):
+        super().__init__(parent)
+        self._fetch_more = fetch_more
+        self._total = 0
+
+    @staticmethod
+    def _key(r: TestRunRow) -> str:
+        return r.run_id
+
+    @staticmethod
+    def _format(r: TestRunRow) -> tuple[str, ...]:
+        return (
+            r.run_id,
+            r.status,
+            str(r.failed_cases),
+            r.category,
+            r.env,
+            r.test_package,
+            "" if r.last_update_at is None else utc_to_local_display(r.last_update_at),
+            r.last_update_message or "",
+        )
+
+    @staticmethod
+    def _is_bold(r: TestRunRow) -> bool:
+        # simple visual cue
+        return r.status in _BAD_STATUSES
+
+    def set_rows(self, rows: list[TestRunRow], total: int) -> None:
+        self._total = total
+        super().set_rows(rows)
+
+    def merge_rows(self, changed: list[TestRunRow], total: int) -> None:
+        """
+        Apply runs that changed since the last refresh: known run_ids update in place,
+        new ones are inserted at their started_at position. A new run older than
+        everything loaded so far is left for fetchMore.
+        """
+        self._total = total
+        where = {x.run_id: j for j, x in enumerate(self._rows)}
+        for r in changed:
+            i = where.get(r.run_id)
+            if i is not None:
+                self._update_row(i, r)
+                continue
+            pos = next((j for j, old in enumerate(self._rows) if old.started_at < r.started_at), None)
+            if pos is None and len(self._rows) < total:
+                continue
+            self._insert_row(len(self._rows) if pos is None else pos, r)
+            where = {x.run_id: j for j, x in enumerate(self._rows)}  # inserts shift indexes
+
+    def append_rows(self, rows: list[TestRunRow], total: int) -> None:
+        self._total = total
+        if not rows:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QtCore.QModelIndex(), first, first + len(rows) - 1)
+        self._rows.extend(rows)
+        self._display.extend(self._format(r) for r in rows)
+        self.endInsertRows()
+
+    def canFetchMore(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> bool:
+        return not parent.isValid() and len(self._rows) < self._total
+
+    def fetchMore(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> None:
+        if not parent.isValid():
+            self._fetch_more(len(self._rows))
+
+
+class LogsTableModel(_RowTableModel):
+    """test_logs rows for the selected run, keyed by id, oldest first."""
+
+    HEADERS = ("Timestamp", "Type", "Status", "Test", "Message", "Worker")
+
+    @staticmethod
+    def _key(l: TestLogRow) -> int:
+        return l.id
+
+    @staticmethod
+    def _format(l: TestLogRow) -> tuple[str, ...]:
+        return (
+            utc_to_local_display(l.timestamp),
+            l.type,
+            l.status or "",
+            l.test_name or "",
+            l.message or "",
+            l.worker or "",
+        )
+
+    def last_id(self) -> int | None:
+        return self._rows[-1].id if self._rows else None
+
+    def append_rows(self, rows: list[TestLogRow], keep: int) -> None:
+        """Append newer rows at the bottom, then drop the oldest so at most `keep` remain."""
+        root = QtCore.QModelIndex()
+        if rows:
+            first = len(self._rows)
+            self.beginInsertRows(root, first, first + len(rows) - 1)
+            self._rows.extend(rows)
+            self._display.extend(self._format(l) for l in rows)
+            self.endInsertRows()
+        excess = len(self._rows) - keep
+        if excess > 0:
+            self.beginRemoveRows(root, 0, excess - 1)
+            del self._rows[:excess]
+            del self._display[:excess]
+            self.endRemoveRows()
+
+
+class StartupSignals(QtCore.QObject):
+    # main() shows the window when the splash-time DB warmup reports back
+    ready = QtCore.Signal(object)
+    failed = QtCore.Signal(str)
+
+
+class TestRunSignals(QtCore.QObject):
+    # Lives on the GUI thread (a QRunnable can't carry signals itself)
     run_finished = QtCore.Signal(str, str)  # run_id, final_status
     run_failed = QtCore.Signal(str, str)  # run_id, error
 
+
+class TestRunWorker(QtCore.QRunnable):
+    """One test run, executed on ControllerWindow's bounded run pool."""
+
     def __init__(
         self,
         *,
+        signals: TestRunSignals,
         db_path: str,
+        base_env_template: dict[str, str],
         run_id: str,
         marker: str,
         clients: list[str],
@@ -113,7 +451,9 @@ class TestRunWorker(QtCore.QThread):
         headless: bool,
     ):
         super().__init__()
+        self.signals = signals
         self.db_path = db_path
+        self.base_env_template = base_env_template
         self.run_id = run_id
         self.marker = marker
         self.clients = clients
@@ -128,12 +468,15 @@ class TestRunWorker(QtCore.QThread):
 
     def run(self):
         final_status = "ERR"
+        error: str | None = None
         try:
-            # Build per-run environment for subprocesses
-            base_env = os.environ.copy()
-            base_env["TEST_ENV"] = self.test_env
-            base_env["HEADLESS"] = "true" if self.headless else "false"
-            base_env["RTVS_DB_PATH"] = self.db_path
+            # Build per-run environment for subprocesses: shared template + per-run overrides
+            base_env = {
+                **self.base_env_template,
+                "TEST_ENV": self.test_env,
+                "HEADLESS": "true" if self.headless else "false",
+                "RTVS_DB_PATH": self.db_path,
+            }
 
             lanes = build_lanes(
                 clients=self.clients,
@@ -177,33 +520,110 @@ class TestRunWorker(QtCore.QThread):
             exit_ok = all(code == 0 for _, _, code in results)
             final_status = "PASS" if exit_ok else "FAIL"
 
-            db = RTVSDB(self.db_path)
-            db.finish_run(self.run_id, final_status)
-            db.close()
-
-            self.run_finished.emit(self.run_id, final_status)
+        except Exception as e:
+            print(e)
+            final_status = "ERR"
+            error = str(e)
 
+        # Single DB open per run, shared by the success and error paths
+        try:
+            db = RTVSDB(self.db_path)
+            try:
+                db.finish_run(self.run_id, final_status)
+            finally:
+                db.close()
         except Exception as e:
             print(e)
+            error = error or str(e)
+
+        if error is None:
+            self.signals.run_finished.emit(self.run_id, final_status)
+        else:
+            self.signals.run_failed.emit(self.run_id, error)
+
+
+class QueryRunner(QtCore.QRunnable):
+    """
+    Runs fn(db) on a QThreadPool thread with its own RTVSDB (sqlite connections are
+    bound to the thread that opened them) and emits the result through `done`.
+    `done`/`failed` are signals on a GUI-thread object, so their slots run on the GUI thread.
+
+    With keep_open=True the RTVSDB stays open for the next runner on the same thread, so
+    its statement and page caches survive between refreshes. Only use it on a pool whose
+    threads never expire, and call close_thread_dbs on that pool before shutdown.
+    """
+
+    _open_dbs: dict[tuple[int, str], RTVSDB] = {}  # (thread ident, db_path) -> RTVSDB
+
+    def __init__(self, db_path: str, fn, done: QtCore.SignalInstance, failed: QtCore.SignalInstance | None = None,
+                 *, keep_open: bool = False):
+        super().__init__()
+        self.db_path = db_path
+        self.fn = fn
+        self.done = done
+        self.failed = failed
+        self.keep_open = keep_open
+
+    def run(self):
+        key = (threading.get_ident(), self.db_path)
+        try:
+            db = self._open_dbs.pop(key, None) or RTVSDB(self.db_path)
             try:
-                db = RTVSDB(self.db_path)
-                db.finish_run(self.run_id, "ERR")
+                result = self.fn(db)
+            except BaseException:
                 db.close()
-            except Exception:
-                pass
-            self.run_failed.emit(self.run_id, str(e))
+                raise
+            if self.keep_open:
+                self._open_dbs[key] = db
+            else:
+                db.close()
+        except Exception as e:
+            if self.failed is not None:
+                self._emit(self.failed, f"{type(e).__name__}: {e}")
+            return
+        self._emit(self.done, result)
+
+    @classmethod
+    def close_thread_dbs(cls) -> None:
+        """Close the kept-open connections of the calling thread."""
+        ident = threading.get_ident()
+        for key in [k for k in cls._open_dbs if k[0] == ident]:
+            cls._open_dbs.pop(key).close()
+
+    @staticmethod
+    def _emit(signal: QtCore.SignalInstance, value) -> None:
+        try:
+            signal.emit(value)
+        except RuntimeError:
+            # receiver (e.g. a closed dialog) was already deleted
+            pass
 
 
 class StartTestDialog(QtWidgets.QDialog):
     """
     Secondary window to gather run config and lane options.
     """
+    # DB lookups run on the thread pool; results come back through these
+    markers_loaded = QtCore.Signal(object)  # (category, {marker: description})
+    clients_and_roles_loaded = QtCore.Signal(object)  # ([(customer_id, customer_name)], [role])
+    desc_loaded = QtCore.Signal(object)  # (marker, description)
+
     def __init__(self, parent: QtWidgets.QWidget, db: RTVSDB):
         super().__init__(parent)
         self.setWindowTitle("Start New Test")
         self.resize(900, 600)
 
         self._db = db
+        self._db_path = str(db.db_path)
+        self._pool = QtCore.QThreadPool.globalInstance()
+        self.markers_loaded.connect(self._apply_markers)
+        self.clients_and_roles_loaded.connect(self._apply_clients_and_roles)
+        self.desc_loaded.connect(self._apply_desc)
+        self._pending_clients = iter(())
+
+        # Test packages don't change while the dialog is open; "Reload" drops these
+        self._markers_cache: dict[str, dict[str, str]] = {}  # category -> {marker: description}
+        self._desc_cache: dict[str, str] = {}
 
         root = QtWidgets.QVBoxLayout(self)
 
@@ -231,6 +651,9 @@ class StartTestDialog(QtWidgets.QDialog):
         self.package_desc_input.setReadOnly(True)
         self.package_desc_input.setPlaceholderText("Select a test package to see its description")
 
+        self.reload_packages_btn = QtWidgets.QPushButton("Reload packages")
+        self.reload_packages_btn.clicked.connect(self._reload_packages)
+
         # Signals
         self.category_combo.currentTextChanged.connect(self.on_category_changed)
         self.marker_combo.currentTextChanged.connect(self.on_marker_changed)
@@ -253,6 +676,7 @@ class StartTestDialog(QtWidgets.QDialog):
         # Row 1: Prefix, Category
         grid.addWidget(labeled_row("Prefix:", self.prefix_input), 0, 0, 1, 1)
         grid.addWidget(labeled_row("Category:", self.category_combo), 0, 1, 1, 1)
+        grid.addWidget(self.reload_packages_btn, 0, 2, 1, 1)
 
         # Row 2: Env, Marker, Headless
         grid.addWidget(labeled_row("Env (TEST_ENV):", self.env_combo), 1, 0, 1, 1)
@@ -354,43 +778,69 @@ class StartTestDialog(QtWidgets.QDialog):
         root.addLayout(btns)
 
         # Populate lists
-        self._populate_clients()
-        self._populate_roles()
+        self._populate_clients_and_roles()
         self._populate_browsers()
 
     def _make_check_list(self, title: str) -> dict:
         group = QtWidgets.QGroupBox(title)
         layout = QtWidgets.QVBoxLayout(group)
         lw = QtWidgets.QListWidget()
+        lw.setUniformItemSizes(True)  # one-line items; skip per-item size hints
         layout.addWidget(lw)
         return {"group": group, "list": lw}
 
-    def _add_check_item(self, lw: QtWidgets.QListWidget, label: str, value: str):
-        it = QtWidgets.QListWidgetItem(label)
-        it.setData(QtCore.Qt.ItemDataRole.UserRole, value)
-        it.setFlags(it.flags() | QtCore.Qt.ItemFlag.ItemIsUserCheckable)
-        it.setCheckState(QtCore.Qt.CheckState.Unchecked)
-        lw.addItem(it)
-
-    def _fetch_markers_for_category(self, category: str) -> list[str]:
+    def _populate_check_list(self, lw: QtWidgets.QListWidget, items: list[tuple[str, str]], *, clear: bool = True) -> None:
+        """Replace (or extend) lw's contents with unchecked (label, value) items in one layout pass."""
+        lw.setUpdatesEnabled(False)
+        lw.blockSignals(True)
+        try:
+            if clear:
+                lw.clear()
+            for label, value in items:
+                it = QtWidgets.QListWidgetItem(label)
+                it.setData(_USER_ROLE, value)
+                it.setFlags(CHECKABLE_FLAGS)
+                it.setCheckState(_UNCHECKED)
+                lw.addItem(it)
+        finally:
+            lw.blockSignals(False)
+            lw.setUpdatesEnabled(True)
+
+    @staticmethod
+    def _fetch_markers_for_category(db: RTVSDB, category: str) -> dict[str, str]:
+        # marker -> description, so picking a marker needs no further query
         category = (category or "").strip().upper()
 
-        if category == "REG":
-            return self._db.fetch_regression_test_packages()
-
-        if category == "DATA":
-            return self._db.fetch_data_integrity_test_packages()
+        if category in ("REG", "DATA"):
+            return db.fetch_test_packages_with_descriptions(category)
 
         # CUSTOM or anything else
         # If you later store CUSTOM packages in test_packages, you can query generically here.
-        return []
+        return {}
 
     def on_category_changed(self, category: str) -> None:
         """
-        Repopulate marker dropdown based on category.
+        Repopulate marker dropdown based on category (cached, else queried off the GUI thread).
         Keep a sentinel so description stays empty until a real marker is selected.
         """
-        markers = self._fetch_markers_for_category(category)
+        markers = self._markers_cache.get(category)
+        if markers is not None:
+            self._apply_markers((category, markers))
+            return
+
+        fetch = self._fetch_markers_for_category
+        self._pool.start(QueryRunner(
+            self._db_path,
+            lambda db: (category, fetch(db, category)),
+            self.markers_loaded,
+        ))
+
+    def _apply_markers(self, result: tuple[str, dict[str, str]]) -> None:
+        category, markers = result
+        self._markers_cache[category] = markers
+        self._desc_cache.update(markers)
+        if category != self.category_combo.currentText():
+            return  # stale: the user already picked another category
 
         self.marker_combo.blockSignals(True)
         self.marker_combo.clear()
@@ -405,53 +855,74 @@ class StartTestDialog(QtWidgets.QDialog):
 
     def on_marker_changed(self, _index: int) -> None:
         """
-        Always pull description from DB for the selected marker.
+        Show the description for the selected marker (cached, else queried off the GUI thread).
         """
         marker = self.marker_combo.currentData()  # None for sentinel
         if not marker:
             self.package_desc_input.setText("")
             return
 
-        desc = self._db.fetch_test_package_description(str(marker)) or ""
-        self.package_desc_input.setText(desc)
-
+        marker = str(marker)
+        desc = self._desc_cache.get(marker)
+        if desc is not None:
+            self.package_desc_input.setText(desc)
+            return
 
-    def _populate_clients(self):
-        lw = self.clients_list["list"]
-        lw.clear()
-        try:
-            rows = self._db.run_query("SELECT customer_id, customer_name FROM customers ORDER BY customer_id ASC;")
-            for cid, name in rows:
-                self._add_check_item(lw, f"{cid} - {name}", str(cid))
-        except Exception:
-            pass
+        self.package_desc_input.setText("…")
+        self._pool.start(QueryRunner(
+            self._db_path,
+            lambda db: (marker, db.fetch_test_package_description(marker) or ""),
+            self.desc_loaded,
+        ))
+
+    def _apply_desc(self, result: tuple[str, str]) -> None:
+        marker, desc = result
+        self._desc_cache[marker] = desc
+        if self.marker_combo.currentData() == marker:
+            self.package_desc_input.setText(desc)
+
+    def _reload_packages(self) -> None:
+        self._markers_cache.clear()
+        self._desc_cache.clear()
+        self.on_category_changed(self.category_combo.currentText())
 
-    def _populate_roles(self):
-        lw = self.roles_list["list"]
-        lw.clear()
-        try:
-            rows = self._db.run_query("SELECT DISTINCT role FROM customer_accounts ORDER BY role ASC;")
-            for (role,) in rows:
-                self._add_check_item(lw, str(role), str(role))
-        except Exception:
-            pass
+    def _populate_clients_and_roles(self):
+        # One pool task and one DB open for both lists
+        self.clients_list["list"].clear()
+        self.roles_list["list"].clear()
+        self._pool.start(QueryRunner(self._db_path, RTVSDB.fetch_clients_and_roles, self.clients_and_roles_loaded))
+
+    def _apply_clients_and_roles(self, result: tuple[list[tuple], list[str]]) -> None:
+        clients, roles = result
+        self._populate_check_list(self.roles_list["list"], [(str(role), str(role)) for role in roles])
+        self._apply_clients(clients)
+
+    def _apply_clients(self, rows: list[tuple]) -> None:
+        # Large customer tables are added a chunk per event-loop turn so the dialog stays responsive
+        self.clients_list["list"].clear()
+        self._pending_clients = iter([(f"{cid} - {name}", str(cid)) for cid, name in rows])
+        self._add_clients_chunk()
+
+    def _add_clients_chunk(self) -> None:
+        chunk = list(islice(self._pending_clients, CHECK_LIST_CHUNK))
+        if not chunk:
+            return
+        self._populate_check_list(self.clients_list["list"], chunk, clear=False)
+        if len(chunk) == CHECK_LIST_CHUNK:
+            QtCore.QTimer.singleShot(0, self._add_clients_chunk)
 
     def _populate_browsers(self):
-        lw = self.browsers_list["list"]
-        lw.clear()
-        for b in ["chrome", "firefox", "edge"]:
-            self._add_check_item(lw, b, b)
+        self._populate_check_list(self.browsers_list["list"], [(b, b) for b in ["chrome", "firefox", "edge"]])
 
     def _checked_values(self, lw: QtWidgets.QListWidget) -> list[str]:
-        out: list[str] = []
-        for i in range(lw.count()):
-            it = lw.item(i)
-            if it.checkState() == QtCore.Qt.CheckState.Checked:
-                out.append(str(it.data(QtCore.Qt.ItemDataRole.UserRole)))
-        return out
+        return [
+            str(it.data(_USER_ROLE))
+            for it in map(lw.item, range(lw.count()))
+            if it.checkState() == _CHECKED
+        ]
 
     def _csv(self, text: str) -> list[str]:
-        return [x.strip() for x in text.split(",") if x.strip()]
+        return [s for x in text.split(",") if (s := x.strip())]
 
     def get_config(self) -> dict:
         marker = self.marker_combo.currentData()
@@ -663,21 +1134,72 @@ class FirstTimeSetupTesterDialog(QtWidgets.QDialog):
 
 
 class ControllerWindow(QtWidgets.QMainWindow):
+    profiles_loaded = QtCore.Signal(object)  # list[ChromeProfileRow]
+    profiles_failed = QtCore.Signal(str)
+    runs_loaded = QtCore.Signal(object)  # (offset, total, list[TestRunRow])
+    logs_loaded = QtCore.Signal(object)  # (run_id, list[TestLogRow])
+    tests_query_failed = QtCore.Signal(str)
+    db_call_done = QtCore.Signal(object)  # (on_done, result) from _run_db
+    db_call_failed = QtCore.Signal(str)
+
     def __init__(self):
         super().__init__()
-        self._workers: dict[str, TestRunWorker] = {}
+        # Runs share a pool capped at the CPU count; extra runs queue instead of each getting a thread
+        self._run_pool = QtCore.QThreadPool(self)
+        self._run_pool.setMaxThreadCount(os.cpu_count() or 4)
+        self._workers: dict[str, TestRunSignals] = {}
+        # Environment for test subprocesses, snapshotted once; runs only add their overrides
+        self._base_env: dict[str, str] = dict(os.environ)
+        self._pool = QtCore.QThreadPool.globalInstance()
+        # Table reads share one long-lived thread and keep its RTVSDB open between refreshes
+        self._query_pool = QtCore.QThreadPool(self)
+        self._query_pool.setMaxThreadCount(1)
+        self._query_pool.setExpiryTimeout(-1)
+        # Profile refreshes run on the pool; a refresh requested mid-load is coalesced into one rerun
+        self._profiles_loading = False
+        self._profiles_reload = False
+        self.profiles_loaded.connect(self._apply_profiles)
+        self.profiles_failed.connect(self._on_profiles_failed)
+        # Same for the Tests tab: runs and logs load on the pool, one in flight per table
+        self._runs_loading = False
+        self._runs_reload = False
+        self._runs_mark: str | None = None  # newest last_update_at seen; None forces a full reload
+        self._logs_loading = False
+        self._logs_reload = False
+        self._logs_run_id: str | None = None  # run whose logs are on screen
+        self.runs_loaded.connect(self._apply_runs)
+        self.logs_loaded.connect(self._apply_logs)
+        self.tests_query_failed.connect(self._on_tests_query_failed)
+        self.db_call_done.connect(self._on_db_call_done)
+        self.db_call_failed.connect(self._on_db_call_failed)
+        self._pending_mfa: list[tuple[str, str | None]] = []  # (profile_name, timestamp or None for NOW)
+        self._mfa_flush_timer = QtCore.QTimer(self)
+        self._mfa_flush_timer.setSingleShot(True)
+        self._mfa_flush_timer.setInterval(200)
+        self._mfa_flush_timer.timeout.connect(lambda: self._safe_call("Update MFA time", self._flush_mfa_stamps))
+        self._loaded_customer_id: int | None = None
+        self._loaded_role_dict: dict[str, str] = {}
         self.setWindowTitle("RTVS Controller")
         self.resize(1000, 600)
         self.showMaximized()
 
         self.assists: ConfigAssists | None = None
+        self._db_path = ""  # set with self.assists
+        self._assets_dir = Path.cwd()
 
         self.tabs = QtWidgets.QTabWidget()
         self.setCentralWidget(self.tabs)
 
-        self.log = QtWidgets.QTextEdit()
+        self.log = QtWidgets.QPlainTextEdit()
         self.log.setReadOnly(True)
         self.log.setMinimumHeight(120)
+        self.log.setMaximumBlockCount(5000)  # oldest lines drop off
+        # _append_log buffers; the timer flushes at most every 50 ms in one append
+        self._log_buf: list[str] = []
+        self._log_flush_timer = QtCore.QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(50)
+        self._log_flush_timer.timeout.connect(self._flush_log)
         self._init_log_watermark()
 
 
@@ -706,17 +1228,11 @@ class ControllerWindow(QtWidgets.QMainWindow):
     # dumb watermark idea
 
     def _init_log_watermark(self) -> None:
-        # 1) Load the logo pixmap once
+        # 1) The logo pixmap is loaded on first paint (see _log_watermark_pixmap)
+        self._log_watermark_path = Path(Config.RTVS_ASSETS_DIR / 'CombinedCo_RTVS2_logo_cropped_textless.png')
+        self._log_watermark_size: tuple[int, int] | None = None
 
-        logo_path = Path(Config.RTVS_ASSETS_DIR / 'CombinedCo_RTVS2_logo_cropped_textless.png')
-        pm = QtGui.QPixmap(str(logo_path))
-        if pm.isNull():
-            self._append_log(f"[WARN] Watermark logo not found: {logo_path}")
-            return
-
-        self._log_watermark_original = pm
-
-        # 2) Create an overlay label inside the QTextEdit viewport
+        # 2) Create an overlay label inside the log viewport
         self._log_watermark_label = QtWidgets.QLabel(self.log.viewport())
         self._log_watermark_label.setAttribute(QtCore.Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)
         self._log_watermark_label.setStyleSheet("background: transparent;")
@@ -727,31 +1243,56 @@ class ControllerWindow(QtWidgets.QMainWindow):
         eff.setOpacity(0.06)  # tweak: 0.05 to 0.15 is a nice range
         self._log_watermark_label.setGraphicsEffect(eff)
 
-        # 4) Keep it updated when the viewport resizes
+        # 4) Keep it updated when the viewport resizes; a window drag fires many
+        #    resize events, so rescale once after they settle
+        self._watermark_debounce = QtCore.QTimer(self)
+        self._watermark_debounce.setSingleShot(True)
+        self._watermark_debounce.setInterval(50)
+        self._watermark_debounce.timeout.connect(self._update_log_watermark)
         self.log.viewport().installEventFilter(self)
-        self._update_log_watermark()
+
+    def _log_watermark_pixmap(self) -> QtGui.QPixmap | None:
+        # Load the logo pixmap once; None if it is missing
+        if not hasattr(self, "_log_watermark_original"):
+            pm = QtGui.QPixmap(str(self._log_watermark_path))
+            if pm.isNull():
+                self._append_log(f"[WARN] Watermark logo not found: {self._log_watermark_path}")
+                self._log_watermark_label.hide()
+                pm = None
+            self._log_watermark_original = pm
+        return self._log_watermark_original
 
     def _update_log_watermark(self) -> None:
         if not hasattr(self, "_log_watermark_label"):
             return
-        if not hasattr(self, "_log_watermark_original"):
-            return
 
         vp = self.log.viewport()
         vw, vh = vp.width(), vp.height()
         if vw <= 0 or vh <= 0:
             return
+        if self._log_watermark_size == (vw, vh):
+            return
+
+        original = self._log_watermark_pixmap()
+        if original is None:
+            return
+        self._log_watermark_size = (vw, vh)
 
         # Scale relative to the log box size
         target_w = int(vw * 1)  # tweak: 0.40 to 0.70
         target_h = int(vh * 1)
 
-        scaled = self._log_watermark_original.scaled(
-            target_w,
-            target_h,
-            QtCore.Qt.AspectRatioMode.KeepAspectRatio,
-            QtCore.Qt.TransformationMode.SmoothTransformation,
-        )
+        # Smooth scaling is costly; reuse the result for sizes seen before
+        key = f"rtvs-wm:{target_w}x{target_h}"
+        scaled = QtGui.QPixmapCache.find(key)
+        if scaled is None or scaled.isNull():
+            scaled = original.scaled(
+                target_w,
+                target_h,
+                _KEEP_AR,
+                _SMOOTH,
+            )
+            QtGui.QPixmapCache.insert(key, scaled)
 
         self._log_watermark_label.setPixmap(scaled)
         self._log_watermark_label.resize(scaled.size())
@@ -768,7 +1309,7 @@ class ControllerWindow(QtWidgets.QMainWindow):
     def eventFilter(self, obj, event):
         if obj == self.log.viewport():
             if event.type() == QtCore.QEvent.Type.Resize:
-                self._update_log_watermark()
+                self._watermark_debounce.start()
             elif event.type() == QtCore.QEvent.Type.Show:
                 self._update_log_watermark()
         return super().eventFilter(obj, event)
@@ -781,7 +1322,14 @@ class ControllerWindow(QtWidgets.QMainWindow):
 
     def _append_log(self, text: str) -> None:
         self._assert_gui_thread()
-        self.log.append(text)
+        self._log_buf.append(text)
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+
+    def _flush_log(self) -> None:
+        if self._log_buf:
+            self.log.appendPlainText("\n".join(self._log_buf))
+            self._log_buf.clear()
 
     def _safe_call(self, label: str, fn, *args, **kwargs):
         try:
@@ -792,9 +1340,21 @@ class ControllerWindow(QtWidgets.QMainWindow):
             QtWidgets.QMessageBox.critical(self, "Error", f"{label}\n\n{e}")
             return None
 
+    def closeEvent(self, event: QtGui.QCloseEvent) -> None:
+        # Kept-open read connections can only be closed on the query thread that opened them
+        self._query_pool.start(QueryRunner.close_thread_dbs)
+        self._query_pool.waitForDone(2000)
+        super().closeEvent(event)
+
     def _init_assists(self):
-        if self.assists is None:
-            self.assists = ConfigAssists()
+        # Called at the top of most handlers; only the first call does any work
+        if self.assists is not None:
+            return
+        self.assists = ConfigAssists()
+        db = self.assists.db
+        # Fixed for the window's lifetime; read once instead of per click
+        self._db_path = str(db.db_path)
+        self._assets_dir = Path(getattr(db, "ASSETS_DIR", Path.cwd()))
         self._refresh_db_path_label()
         # self._refresh_profiles_table()
         self._append_log("[OK] ConfigAssists initialized and first-time setup ensured.")
@@ -804,6 +1364,32 @@ class ControllerWindow(QtWidgets.QMainWindow):
             raise RuntimeError("ConfigAssists not initialized.")
         return self.assists.db
 
+    def _run_db(self, label: str, fn, on_done=None) -> None:
+        """
+        Run fn(db) on the query thread (its own RTVSDB; calls run one at a time, in order),
+        then on_done(result) on the GUI thread. fn must not touch widgets.
+        """
+        self._init_assists()
+
+        def job(db: RTVSDB):
+            try:
+                return on_done, fn(db)
+            except Exception as e:
+                raise RuntimeError(f"{label}: {e}") from e
+
+        self._query_pool.start(QueryRunner(
+            self._db_path, job, self.db_call_done, self.db_call_failed, keep_open=True
+        ))
+
+    def _on_db_call_done(self, done) -> None:
+        on_done, result = done
+        if on_done is not None:
+            self._safe_call("Apply DB result", on_done, result)
+
+    def _on_db_call_failed(self, error: str) -> None:
+        self._append_log(f"[ERROR] {error}")
+        QtWidgets.QMessageBox.critical(self, "Error", error)
+
     # -------------------------
     # Setup tab
     # -------------------------
@@ -843,11 +1429,8 @@ class ControllerWindow(QtWidgets.QMainWindow):
     def _refresh_db_path_label(self):
         if not self.assists:
             return
-        db = self._db()
-        db_path = getattr(db, "db_path", None)
-        assets_dir = getattr(db, "ASSETS_DIR", None)
-        self.db_path_label.setText(str(db_path) if db_path else "(missing db_path on RTVSDB)")
-        self.assets_dir_label.setText(str(assets_dir) if assets_dir else "(missing ASSETS_DIR on RTVSDB)")
+        self.db_path_label.setText(self._db_path)
+        self.assets_dir_label.setText(str(self._assets_dir))
 
     def _run_setup(self):
         self._init_assists()  # ensures exists
@@ -864,7 +1447,7 @@ class ControllerWindow(QtWidgets.QMainWindow):
 
     def _reload_customers_json(self):
         self._init_assists()
-        start_dir = str(getattr(self._db(), "ASSETS_DIR", Path.cwd()))
+        start_dir = str(self._assets_dir)
         path, _ = QtWidgets.QFileDialog.getOpenFileName(
             self,
             "Select customers JSON",
@@ -881,8 +1464,7 @@ class ControllerWindow(QtWidgets.QMainWindow):
 
     def _open_assets_folder(self):
         self._init_assists()
-        assets_dir = Path(getattr(self._db(), "ASSETS_DIR", Path.cwd()))
-        url = QtCore.QUrl.fromLocalFile(str(assets_dir))
+        url = QtCore.QUrl.fromLocalFile(str(self._assets_dir))
         QtGui.QDesktopServices.openUrl(url)
 
     # -------------------------
@@ -926,8 +1508,7 @@ class ControllerWindow(QtWidgets.QMainWindow):
         top_row.addStretch(1)
         layout.addLayout(top_row)
 
-        self.profiles_model = QtGui.QStandardItemModel(0, 5)
-        self.profiles_model.setHorizontalHeaderLabels(["ID", "Profile", "Status", "Active", "Last MFA"])
+        self.profiles_model = ProfilesModel(self)
 
         self.profiles_view = QtWidgets.QTableView()
         self.profiles_view.setModel(self.profiles_model)
@@ -935,61 +1516,52 @@ class ControllerWindow(QtWidgets.QMainWindow):
         self.profiles_view.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.SingleSelection)
         self.profiles_view.horizontalHeader().setStretchLastSection(True)
         self.profiles_view.setSortingEnabled(False)
+        # Fixed geometry: a model reset never has to measure cell contents for widths/heights
+        self.profiles_view.horizontalHeader().setDefaultSectionSize(120)
+        self.profiles_view.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.ResizeMode.Fixed)
+        self.profiles_view.setVerticalScrollMode(QtWidgets.QAbstractItemView.ScrollMode.ScrollPerPixel)
 
         layout.addWidget(self.profiles_view)
 
         self.tabs.addTab(tab, "Chrome Profiles")
 
-    def _query_profiles(self) -> list[ChromeProfileRow]:
-        db = self._db()
-        db.cursor.execute(
-            """
-            SELECT id, profile_name, currently_running, is_active, last_mfa_time
-            FROM chrome_profiles
-            ORDER BY id ASC;
-            """
-        )
-        rows = db.cursor.fetchall()
-        out: list[ChromeProfileRow] = []
-        for r in rows:
-            out.append(
-                ChromeProfileRow(
-                    id=int(r[0]),
-                    profile_name=str(r[1]),
-                    currently_running=(None if r[2] is None else str(r[2])),
-                    is_active=int(r[3]),
-                    last_mfa_time=("" if r[4] is None else str(r[4])),
-                )
-            )
-        return out
+    @staticmethod
+    def _query_profiles(db: RTVSDB) -> list[ChromeProfileRow]:
+        db.cursor.execute(_SELECT_PROFILES_SQL)
+        return list(map(ChromeProfileRow._make, db.cursor))
 
     def _refresh_profiles_table(self):
         self._init_assists()
-        profiles = self._query_profiles()
-
-        self.profiles_model.removeRows(0, self.profiles_model.rowCount())
-        for p in profiles:
-            items = [
-                QtGui.QStandardItem(str(p.id)),
-                QtGui.QStandardItem(p.profile_name),
-                QtGui.QStandardItem("" if p.currently_running is None else p.currently_running),
-                QtGui.QStandardItem(str(p.is_active)),
-                QtGui.QStandardItem(utc_to_local_display(p.last_mfa_time)),
-            ]
-            # simple visual cue for active
-            if p.is_active == 1:
-                for it in items:
-                    it.setFont(QtGui.QFont(it.font().family(), it.font().pointSize(), QtGui.QFont.Weight.Bold))
-            self.profiles_model.appendRow(items)
-
+        if self._profiles_loading:
+            self._profiles_reload = True
+            return
+        self._profiles_loading = True
+        self._query_pool.start(QueryRunner(
+            self._db_path, self._query_profiles, self.profiles_loaded, self.profiles_failed, keep_open=True
+        ))
+
+    def _apply_profiles(self, profiles: list[ChromeProfileRow]) -> None:
+        self._profiles_loading = False
+        self.profiles_model.set_rows(profiles)
         self._append_log(f"[OK] Loaded {len(profiles)} chrome profiles.")
+        self._rerun_pending_profiles_refresh()
+
+    def _on_profiles_failed(self, error: str) -> None:
+        self._profiles_loading = False
+        self._append_log(f"[ERROR] Refresh profiles: {error}")
+        self._rerun_pending_profiles_refresh()
+
+    def _rerun_pending_profiles_refresh(self) -> None:
+        if self._profiles_reload:
+            self._profiles_reload = False
+            self._refresh_profiles_table()
 
     def _selected_profile_name(self) -> str | None:
         idxs = self.profiles_view.selectionModel().selectedRows()
         if not idxs:
             return None
         row = idxs[0].row()
-        return self.profiles_model.item(row, 1).text()
+        return self.profiles_model.row_at(row).profile_name
 
     def _set_selected_profile_active(self):
         name = self._selected_profile_name()
@@ -1015,15 +1587,7 @@ class ControllerWindow(QtWidgets.QMainWindow):
             QtWidgets.QMessageBox.information(self, "Select a row", "Select a profile row first.")
             return
 
-        # Safer than your string-format SQL: do parameterized update directly here
-        db = self._db()
-        with db.connection:
-            db.cursor.execute(
-                "UPDATE chrome_profiles SET last_mfa_time = CURRENT_TIMESTAMP WHERE profile_name = ?;",
-                (name,),
-            )
-        self._append_log(f"[OK] MFA stamped (NOW) for: {name}")
-        self._refresh_profiles_table()
+        self._queue_mfa_stamp(name, None)
 
     def _stamp_mfa_custom(self):
         name = self._selected_profile_name()
@@ -1036,19 +1600,44 @@ class ControllerWindow(QtWidgets.QMainWindow):
             QtWidgets.QMessageBox.information(self, "Missing timestamp", "Enter a custom timestamp first.")
             return
 
-        # Parameterized update for safety
-        db = self._db()
-        with db.connection:
-            db.cursor.execute(
-                "UPDATE chrome_profiles SET last_mfa_time = ? WHERE profile_name = ?;",
-                (ts, name),
-            )
-        self._append_log(f"[OK] MFA stamped (custom) for: {name} -> {ts}")
+        self._queue_mfa_stamp(name, ts)
+
+    def _queue_mfa_stamp(self, name: str, ts: str | None) -> None:
+        # Clicks within 200 ms of each other are written in one transaction with one refresh
+        self._pending_mfa.append((name, ts))
+        self._mfa_flush_timer.start()
+
+    def _flush_mfa_stamps(self) -> None:
+        pending, self._pending_mfa = self._pending_mfa, []
+        if not pending:
+            return
+
+        def write(db: RTVSDB) -> None:
+            # Parameterized, unlike edit_chrome_profile_table's string-format SQL.
+            # Consecutive stamps with the same timestamp share one executemany; click order is kept.
+            with db.transaction():
+                for ts, group in groupby(pending, key=lambda p: p[1]):
+                    db.stamp_mfa_times([name for name, _ in group], ts)
+
+        self._run_db("Update MFA time", write, lambda _: self._on_mfa_stamped(pending))
+
+    def _on_mfa_stamped(self, pending: list[tuple[str, str | None]]) -> None:
+        for name, ts in pending:
+            if ts is None:
+                self._append_log(f"[OK] MFA stamped (NOW) for: {name}")
+            else:
+                self._append_log(f"[OK] MFA stamped (custom) for: {name} -> {ts}")
         self._refresh_profiles_table()
 
     def _fetch_first_inactive(self):
-        self._init_assists()
-        name = self.assists.fetch_first_inactive_profile()
+        claimed_by = ConfigAssists.profile_claim_tag()
+        self._run_db(
+            "Fetch first inactive",
+            lambda db: db.claim_first_inactive_chrome_profile(claimed_by=claimed_by),
+            self._on_first_inactive_claimed,
+        )
+
+    def _on_first_inactive_claimed(self, name: str | None) -> None:
         if not name:
             QtWidgets.QMessageBox.information(self, "No inactive profiles", "All profiles appear active.")
             self._append_log("[INFO] No inactive profile found.")
@@ -1069,7 +1658,9 @@ class ControllerWindow(QtWidgets.QMainWindow):
 
         self.customer_name_combo = QtWidgets.QComboBox()
         self.customer_name_combo.setEditable(False)
-        self.customer_name_combo.addItems(sorted(db.get_customer_names_list()))
+        # customer_id rides along as item data, so handlers don't look it up by name
+        for customer_id, customer_name in sorted(db.fetch_customers(), key=lambda c: c[1]):
+            self.customer_name_combo.addItem(customer_name, customer_id)
         top.addWidget(self.customer_name_combo)
 
 
@@ -1111,26 +1702,34 @@ class ControllerWindow(QtWidgets.QMainWindow):
         self.tabs.addTab(tab, "Customers")
 
     def _load_customer(self):
-        self._init_assists()
-        db = self._db()
-        name = self.customer_name_combo.currentText()
-        customer_id = db.get_customer_id_from_name(name)
-
-
-
-        role_dict = self.assists.get_role_dict_for_customer_id(customer_id)
-        self.roles_table.setRowCount(0)
-
-        for role, username in role_dict.items():
-            r = self.roles_table.rowCount()
-            self.roles_table.insertRow(r)
+        customer_id = self.customer_name_combo.currentData()
+        self._run_db(
+            "Load customer",
+            lambda db: db.get_role_dict_for_customer_id(customer_id),
+            lambda roles: self._apply_customer_roles(customer_id, roles),
+        )
 
-            role_item = QtWidgets.QTableWidgetItem(str(role))
-            role_item.setFlags(role_item.flags() & ~QtCore.Qt.ItemFlag.ItemIsEditable)
-            self.roles_table.setItem(r, 0, role_item)
+    def _apply_customer_roles(self, customer_id, roles: dict) -> None:
+        role_dict = {
+            str(role): "" if username is None else str(username)
+            for role, username in roles.items()
+        }
+        # What the table was loaded with (as displayed), so "Update all rows" only writes edited usernames
+        self._loaded_customer_id = customer_id
+        self._loaded_role_dict = role_dict
 
-            user_item = QtWidgets.QTableWidgetItem("" if username is None else str(username))
-            self.roles_table.setItem(r, 1, user_item)
+        # Size the table once, then fill cells, instead of an insertRow per role
+        self.roles_table.setUpdatesEnabled(False)
+        try:
+            self.roles_table.setRowCount(0)
+            self.roles_table.setRowCount(len(role_dict))
+            for r, (role, username) in enumerate(role_dict.items()):
+                role_item = QtWidgets.QTableWidgetItem(role)
+                role_item.setFlags(role_item.flags() & ~QtCore.Qt.ItemFlag.ItemIsEditable)
+                self.roles_table.setItem(r, 0, role_item)
+                self.roles_table.setItem(r, 1, QtWidgets.QTableWidgetItem(username))
+        finally:
+            self.roles_table.setUpdatesEnabled(True)
 
         self._append_log(f"[OK] Loaded {len(role_dict)} roles for customer_id={customer_id}")
 
@@ -1142,9 +1741,7 @@ class ControllerWindow(QtWidgets.QMainWindow):
 
     def _update_selected_role(self):
         self._init_assists()
-        db = self._db()
-        name = self.customer_name_combo.currentText()
-        customer_id = db.get_customer_id_from_name(name)
+        customer_id = self.customer_name_combo.currentData()
         row = self._selected_role_row()
         if row is None:
             QtWidgets.QMessageBox.information(self, "Select a row", "Select a role row first.")
@@ -1153,26 +1750,41 @@ class ControllerWindow(QtWidgets.QMainWindow):
         role = self.roles_table.item(row, 0).text()
         username = self.roles_table.item(row, 1).text().strip()
 
-        self.assists.update_username_for_role(customer_id, role, username)
-        self._append_log(f"[OK] Updated username for customer_id={customer_id}, role={role} -> {username}")
+        def done(_):
+            if customer_id == self._loaded_customer_id:
+                self._loaded_role_dict[role] = username
+            self._append_log(f"[OK] Updated username for customer_id={customer_id}, role={role} -> {username}")
+
+        self._run_db(
+            "Update selected role", lambda db: db.update_username_for_role(customer_id, role, username), done
+        )
 
     def _update_all_roles(self):
         self._init_assists()
-        db = self._db()
-        name = self.customer_name_combo.currentText()
-        customer_id = db.get_customer_id_from_name(name)
+        customer_id = self.customer_name_combo.currentData()
 
         n = self.roles_table.rowCount()
         if n == 0:
             QtWidgets.QMessageBox.information(self, "No data", "Load a customer first.")
             return
 
-        for row in range(n):
-            role = self.roles_table.item(row, 0).text()
-            username = self.roles_table.item(row, 1).text().strip()
-            self.assists.update_username_for_role(customer_id, role, username)
+        # Read the whole table in one sweep before any SQL
+        item = self.roles_table.item
+        pairs = [(item(row, 0).text(), item(row, 1).text().strip()) for row in range(n)]
 
-        self._append_log(f"[OK] Updated all {n} roles for customer_id={customer_id}")
+        loaded = self._loaded_role_dict if customer_id == self._loaded_customer_id else {}
+        changed = [(role, username) for role, username in pairs if loaded.get(role) != username]
+
+        if not changed:
+            self._append_log(f"[OK] Updated 0 of {n} roles for customer_id={customer_id}")
+            return
+
+        def done(_):
+            if loaded is self._loaded_role_dict:
+                loaded.update(changed)
+            self._append_log(f"[OK] Updated {len(changed)} of {n} roles for customer_id={customer_id}")
+
+        self._run_db("Update all roles", lambda db: db.update_usernames_for_roles(customer_id, changed), done)
 
     # -------------------------
     # Tests tab
@@ -1190,7 +1802,7 @@ class ControllerWindow(QtWidgets.QMainWindow):
         top_row = QtWidgets.QHBoxLayout()
 
         self.btn_tests_refresh = QtWidgets.QPushButton("Refresh")
-        self.btn_tests_refresh.clicked.connect(lambda: self._safe_call("Refresh tests", self._refresh_tests_views))
+        self.btn_tests_refresh.clicked.connect(lambda: self._safe_call("Refresh tests", self._refresh_tests_views, True))
         top_row.addWidget(self.btn_tests_refresh)
 
         self.btn_start_new_test = QtWidgets.QPushButton("Start new test...")
@@ -1205,10 +1817,7 @@ class ControllerWindow(QtWidgets.QMainWindow):
         layout.addLayout(top_row)
 
         # Runs table (test_runs)
-        self.runs_model = QtGui.QStandardItemModel(0, 8)
-        self.runs_model.setHorizontalHeaderLabels([
-            "Run ID", "Status", "Failed", "Category", "Env", "Package", "Last Update", "Last Message"
-        ])
+        self.runs_model = RunsTableModel(self._fetch_runs_page, self)
 
         self.runs_view = QtWidgets.QTableView()
         self.runs_view.setModel(self.runs_model)
@@ -1220,10 +1829,7 @@ class ControllerWindow(QtWidgets.QMainWindow):
         layout.addWidget(self.runs_view)
 
         # Logs table (test_logs) for selected run
-        self.logs_model = QtGui.QStandardItemModel(0, 6)
-        self.logs_model.setHorizontalHeaderLabels([
-            "Timestamp", "Type", "Status", "Test", "Message", "Worker"
-        ])
+        self.logs_model = LogsTableModel(self)
 
         self.logs_view = QtWidgets.QTableView()
         self.logs_view.setModel(self.logs_model)
@@ -1235,152 +1841,183 @@ class ControllerWindow(QtWidgets.QMainWindow):
         layout.addWidget(QtWidgets.QLabel("Latest logs for selected run (test_logs):"))
         layout.addWidget(self.logs_view)
 
-        # When selection changes, refresh logs
-        self.runs_view.selectionModel().selectionChanged.connect(
-            lambda *_: self._safe_call("Refresh run logs", self._refresh_logs_for_selected_run)
+        # When selection changes, refresh logs; arrow-keying through runs only loads the last one
+        self._logs_debounce = QtCore.QTimer(self)
+        self._logs_debounce.setSingleShot(True)
+        self._logs_debounce.setInterval(120)
+        self._logs_debounce.timeout.connect(
+            lambda: self._safe_call("Refresh run logs", self._refresh_logs_for_selected_run)
         )
+        self.runs_view.selectionModel().selectionChanged.connect(lambda *_: self._logs_debounce.start())
 
         self.tabs.addTab(tab, "Tests")
+        self._tests_tab = tab
+        self.tabs.currentChanged.connect(self._on_tab_changed)
 
         # initial load (safe)
         self._safe_call("Initial tests refresh", self._refresh_tests_views)
 
-    def _query_runs(self, limit: int = 200) -> list[TestRunRow]:
-        db = self._db()
-        cursor = db.connection.cursor()
-        cursor.execute(
-            f"""
-            SELECT
-                run_id, category, env, test_package, browsers,
-                COALESCE(clients,''), COALESCE(user_roles,''), threads, multiprocessing,
-                started_at, ended_at, status, failed_cases,
-                last_update_at, last_update_message
-            FROM test_runs
-            ORDER BY started_at DESC
-            LIMIT {int(limit)};
-            """
-        )
-        rows = cursor.fetchall()
-        out: list[TestRunRow] = []
-        for r in rows:
-            out.append(TestRunRow(
-                run_id=str(r[0]),
-                category=str(r[1]),
-                env=str(r[2]),
-                test_package=str(r[3]),
-                browsers=str(r[4]),
-                clients=str(r[5]),
-                user_roles=str(r[6]),
-                threads=int(r[7]),
-                multiprocessing=int(r[8]),
-                started_at=str(r[9]),
-                ended_at=(None if r[10] is None else str(r[10])),
-                status=str(r[11]),
-                failed_cases=int(r[12]),
-                last_update_at=(None if r[13] is None else str(r[13])),
-                last_update_message=(None if r[14] is None else str(r[14])),
-            ))
-        return out
-
-    def _query_logs(self, run_id: str, limit: int = 200) -> list[TestLogRow]:
-        db = self._db()
-        cursor = db.connection.cursor()
+    @staticmethod
+    def _query_runs(
+            db: RTVSDB, limit: int = RUNS_PAGE_SIZE, offset: int = 0, since: str | None = None
+    ) -> tuple[int, list[TestRunRow]]:
+        """One page of runs, or with `since`, every run updated since then (limit/offset unused)."""
+        cursor = db.cursor
+        cursor.execute(_COUNT_RUNS_SQL)
+        total = int(cursor.fetchone()[0])
+        if since is None:
+            cursor.execute(_SELECT_RUNS_SQL, (int(limit), int(offset)))
+        else:
+            cursor.execute(_SELECT_CHANGED_RUNS_SQL, (since,))
+        return total, list(map(TestRunRow._make, cursor))
 
-        cursor.execute(
-            f"""
-            SELECT timestamp, type, status, test_name, message, worker, pid, current_url
-            FROM test_logs
-            WHERE run_id = ?
-            ORDER BY id DESC
-            LIMIT {int(limit)};
-            """,
-            (run_id,),
-        )
-        rows = cursor.fetchall()
-        out: list[TestLogRow] = []
-        for r in rows:
-            out.append(TestLogRow(
-                timestamp=("" if r[0] is None else str(r[0])),
-                type=str(r[1]),
-                status=str(r[2]),
-                test_name=(None if r[3] is None else str(r[3])),
-                message=(None if r[4] is None else str(r[4])),
-                worker=(None if r[5] is None else str(r[5])),
-                pid=(None if r[6] is None else int(r[6])),
-                current_url=(None if r[7] is None else str(r[7])),
-            ))
-        return out
-
-    def _refresh_tests_views(self):
+    @staticmethod
+    def _query_logs(db: RTVSDB, run_id: str, limit: int = LOGS_WINDOW, after: int | None = None) -> list[TestLogRow]:
+        """Newest `limit` log rows of a run, oldest first; with `after`, only rows with a higher id."""
+        cursor = db.cursor
+
+        if after is None:
+            cursor.execute(_SELECT_RUN_LOGS_SQL, (run_id, int(limit)))
+        else:
+            cursor.execute(_SELECT_NEW_RUN_LOGS_SQL, (run_id, after, int(limit)))
+        return list(map(TestLogRow._make, cursor))
+
+    def _refresh_tests_views(self, hard: bool = False):
         self._assert_gui_thread()
         self._init_assists()
+        if hard:
+            # Full reload; also the only path that drops runs deleted from test_runs
+            self._runs_mark = None
+            self._logs_run_id = None
         self._refresh_runs_table()
         self._refresh_logs_for_selected_run()
 
+    def _on_tab_changed(self, index: int) -> None:
+        if self.tabs.widget(index) is self._tests_tab:
+            self._safe_call("Refresh tests", self._refresh_tests_views, True)
+
     def _refresh_runs_table(self):
         self._assert_gui_thread()
-        runs = self._query_runs()
-
-        # keep currently selected run_id if possible
-        selected = self._selected_run_id()
-
-        self.runs_model.removeRows(0, self.runs_model.rowCount())
-        for r in runs:
-            items = [
-                QtGui.QStandardItem(r.run_id),
-                QtGui.QStandardItem(r.status),
-                QtGui.QStandardItem(str(r.failed_cases)),
-                QtGui.QStandardItem(r.category),
-                QtGui.QStandardItem(r.env),
-                QtGui.QStandardItem(r.test_package),
-                QtGui.QStandardItem("" if r.last_update_at is None else utc_to_local_display(r.last_update_at)),
-                QtGui.QStandardItem("" if r.last_update_message is None else r.last_update_message),
-            ]
-
-            # simple visual cue
-            if r.status in ("FAIL", "ERR"):
-                f = QtGui.QFont(items[0].font())
-                f.setBold(True)
-                for it in items:
-                    it.setFont(f)
-
-            self.runs_model.appendRow(items)
-
-        # reselect
-        if selected:
-            for row in range(self.runs_model.rowCount()):
-                if self.runs_model.item(row, 0).text() == selected:
-                    self.runs_view.selectRow(row)
-                    break
-
-        self._append_log(f"[OK] Loaded {len(runs)} runs from test_runs.")
+        if self._runs_loading:
+            self._runs_reload = True
+            return
+        if self._runs_mark is not None and self.runs_model.rowCount():
+            self._start_runs_query(0, 0, self._runs_mark)
+            return
+        # Reload everything already scrolled into view, at least one page
+        limit = max(RUNS_PAGE_SIZE, self.runs_model.rowCount())
+        self._start_runs_query(limit, 0)
+
+    def _fetch_runs_page(self, offset: int) -> None:
+        # Called by RunsTableModel.fetchMore; the view asks again on the next scroll if we're busy
+        if self._runs_loading:
+            return
+        self._start_runs_query(RUNS_PAGE_SIZE, offset)
+
+    def _start_runs_query(self, limit: int, offset: int, since: str | None = None) -> None:
+        self._runs_loading = True
+        self._query_pool.start(QueryRunner(
+            self._db_path,
+            lambda db: (offset, since, *self._query_runs(db, limit, offset, since)),
+            self.runs_loaded,
+            self.tests_query_failed,
+            keep_open=True,
+        ))
+
+    def _apply_runs(self, result: tuple[int, str | None, int, list[TestRunRow]]) -> None:
+        self._runs_loading = False
+        offset, since, total, runs = result
+
+        if since is not None:
+            self.runs_model.merge_rows(runs, total)
+            if self._runs_mark is not None:
+                self._runs_mark = max(self._runs_mark, self._max_run_mark(runs))
+        elif offset:
+            # Next page; skip it if a refresh replaced the rows in the meantime
+            if offset == self.runs_model.rowCount():
+                self.runs_model.append_rows(runs, total)
+        else:
+            # set_rows diffs in place, so the selection normally survives; a reorder resets it
+            selected = self._selected_run_id()
+            self.runs_model.set_rows(runs, total)
+
+            # reselect
+            if selected and self._selected_run_id() != selected:
+                for row in range(self.runs_model.rowCount()):
+                    if self.runs_model.row_at(row).run_id == selected:
+                        self.runs_view.selectRow(row)
+                        break
+
+            self._runs_mark = self._max_run_mark(runs) or None
+            self._append_log(f"[OK] Loaded {len(runs)} of {total} runs from test_runs.")
+
+        if self._runs_reload:
+            self._runs_reload = False
+            self._refresh_runs_table()
+
+    @staticmethod
+    def _max_run_mark(runs: list[TestRunRow]) -> str:
+        return max((r.last_update_at or r.started_at for r in runs), default="")
+
+    def _on_tests_query_failed(self, error: str) -> None:
+        # Either query may have failed; neither result is coming, so both may reload
+        self._runs_loading = self._logs_loading = False
+        self._append_log(f"[ERROR] Refresh tests: {error}")
+        if self._runs_reload:
+            self._runs_reload = False
+            self._refresh_runs_table()
+        if self._logs_reload:
+            self._logs_reload = False
+            self._refresh_logs_for_selected_run()
 
     def _selected_run_id(self) -> str | None:
         idxs = self.runs_view.selectionModel().selectedRows()
         if not idxs:
             return None
         row = idxs[0].row()
-        return self.runs_model.item(row, 0).text()
+        return self.runs_model.row_at(row).run_id
 
     def _refresh_logs_for_selected_run(self):
         self._assert_gui_thread()
+        if self._logs_loading:
+            self._logs_reload = True
+            return
         run_id = self._selected_run_id()
-        self.logs_model.removeRows(0, self.logs_model.rowCount())
         if not run_id:
+            self._logs_run_id = None
+            self.logs_model.set_rows([])
+            return
+        # Same run as on screen: fetch only what was logged since; a new run gets a full window
+        after = self.logs_model.last_id() if run_id == self._logs_run_id else None
+        self._logs_loading = True
+        self._query_pool.start(QueryRunner(
+            self._db_path,
+            lambda db: (run_id, after, self._query_logs(db, run_id, after=after)),
+            self.logs_loaded,
+            self.tests_query_failed,
+            keep_open=True,
+        ))
+
+    def _apply_logs(self, result: tuple[str, int | None, list[TestLogRow]]) -> None:
+        self._logs_loading = False
+        if self._logs_reload:
+            # Selection moved while loading; this result is stale
+            self._logs_reload = False
+            self._refresh_logs_for_selected_run()
             return
 
-        logs = self._query_logs(run_id)
+        run_id, after, logs = result
+        if run_id != self._selected_run_id():
+            self._logs_run_id = None
+            self.logs_model.set_rows([])
+            return
 
-        for l in reversed(logs):  # show oldest at top
-            items = [
-                QtGui.QStandardItem(utc_to_local_display(l.timestamp)),
-                QtGui.QStandardItem(l.type),
-                QtGui.QStandardItem(l.status),
-                QtGui.QStandardItem("" if l.test_name is None else l.test_name),
-                QtGui.QStandardItem("" if l.message is None else l.message),
-                QtGui.QStandardItem("" if l.worker is None else l.worker),
-            ]
-            self.logs_model.appendRow(items)
+        # rows arrive oldest first, which is the display order
+        if after is None:
+            self.logs_model.set_rows(logs)
+        else:
+            self.logs_model.append_rows(logs, keep=LOGS_WINDOW)
+        self._logs_run_id = run_id
 
     def _export_reports_xlsx_for_selected_run(self):
 
@@ -1522,8 +2159,9 @@ class ControllerWindow(QtWidgets.QMainWindow):
         """
         self._init_assists()
 
-        # Create a fresh ConfigAssists just for run creation (keeps controller state clean)
-        ca = ConfigAssists()
+        # Fresh RunConfiguration on the window's ConfigAssists; its DB connection is already open
+        ca = self.assists
+        ca.set_run_configuration(RunConfiguration())
 
         rc = ca.get_run_configuration()
         rc.prefix = cfg["prefix"]
@@ -1551,21 +2189,22 @@ class ControllerWindow(QtWidgets.QMainWindow):
         ca.set_unique_id()
         ca.create_run_id()
 
-        # Insert run
-        ca.db.insert_test_run(rc)
-
-        # Controller-side log line
-        ca.db.insert_test_log(
-            run_id=rc.run_id,
-            type_="controller",
-            status="Info",
-            message=f"Run launched from Controller UI | marker={rc.test_package} | lanes<= {rc.threads}",
-            test_package=rc.test_package,
-        )
+        db = self._db()
+        with db.transaction():
+            # Insert run
+            db.insert_test_run(rc)
+
+            # Controller-side log line
+            db.insert_test_log(
+                run_id=rc.run_id,
+                type_="controller",
+                status="Info",
+                message=f"Run launched from Controller UI | marker={rc.test_package} | lanes<= {rc.threads}",
+                test_package=rc.test_package,
+            )
 
-        # Close that helper DB (tests will open their own connections)
-        db_path = str(ca.db.db_path)
-        ca.db.close()
+        # Tests and the worker open their own connections
+        db_path = str(db.db_path)
 
         # Refresh UI to show the new run immediately
         self._refresh_tests_views()
@@ -1573,8 +2212,11 @@ class ControllerWindow(QtWidgets.QMainWindow):
         # Start worker in background (so UI does not freeze)
         self._append_log(f"[OK] Starting lanes for run_id={rc.run_id}")
 
+        signals = TestRunSignals(self)
         worker = TestRunWorker(
+            signals=signals,
             db_path=db_path,
+            base_env_template=self._base_env,
             run_id=rc.run_id,
             marker=cfg["marker"],
             clients=clients,
@@ -1588,16 +2230,18 @@ class ControllerWindow(QtWidgets.QMainWindow):
             headless=bool(cfg["headless"]),
         )
 
-        self._workers[rc.run_id] = worker
+        self._workers[rc.run_id] = signals
 
-        worker.run_finished.connect(self._on_run_finished)
-        worker.run_failed.connect(self._on_run_failed)
+        signals.run_finished.connect(self._on_run_finished)
+        signals.run_failed.connect(self._on_run_failed)
 
         # Cleanup so dict doesn't grow forever
-        worker.run_finished.connect(lambda rid, *_: self._cleanup_worker(rid))
-        worker.run_failed.connect(lambda rid, *_: self._cleanup_worker(rid))
+        signals.run_finished.connect(lambda rid, *_: self._cleanup_worker(rid))
+        signals.run_failed.connect(lambda rid, *_: self._cleanup_worker(rid))
 
-        worker.start()
+        if self._run_pool.activeThreadCount() >= self._run_pool.maxThreadCount():
+            self._append_log(f"[INFO] {self._run_pool.maxThreadCount()} runs already active; run_id={rc.run_id} is queued")
+        self._run_pool.start(worker)
 
     def _on_run_finished(self, run_id: str, status: str):
         self._append_log(f"[OK] Run finished: {run_id} -> {status}")
@@ -1608,11 +2252,10 @@ class ControllerWindow(QtWidgets.QMainWindow):
         self._refresh_tests_views()
 
     def _cleanup_worker(self, run_id: str):
-        w = self._workers.pop(run_id, None)
-        if w is not None:
-            w.quit()
-            w.wait(2000)
-            w.deleteLater()
+        signals = self._workers.pop(run_id, None)
+        if signals is not None:
+            # The pool deletes the runnable itself; the signals object goes once its queued events are delivered
+            signals.deleteLater()
 
 
 def main():
@@ -1627,13 +2270,24 @@ def main():
     splash.setWindowFlags(splash.windowFlags() | Qt.WindowType.WindowStaysOnTopHint)
     splash.show()
     app.processEvents()
-    time.sleep(2)  # simulate loading time
-
-    win = ControllerWindow()
-    win.setWindowIcon(app_icon)
-    win.show()
 
-    splash.finish(win)
+    # Open the DB (schema bootstrap, first runs page) on the pool while the splash is up;
+    # the window is built once that is done, or has failed and will report it itself.
+    windows: list[ControllerWindow] = []
+
+    def show_window(*_):
+        win = ControllerWindow()
+        win.setWindowIcon(app_icon)
+        win.show()
+        splash.finish(win)
+        windows.append(win)
+
+    warmup = StartupSignals()
+    warmup.ready.connect(show_window)
+    warmup.failed.connect(show_window)
+    QtCore.QThreadPool.globalInstance().start(
+        QueryRunner(str(RTVSDB.DEFAULT_DB_PATH), ControllerWindow._query_runs, warmup.ready, warmup.failed)
+    )
 
     sys.exit(app.exec())
 
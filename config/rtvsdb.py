@@ -2,6 +2,7 @@ import sqlite3
 import json
 import os
 import time
+from contextlib import contextmanager
 from pathlib import Path
 from core.config import Config
 
@@ -11,6 +12,80 @@ Functions :
 
 '''
 
+# test_logs rows are passed around as tuples in this column order
+# (see ConfigAssists._log and RTVSDB.insert_test_logs_many)
+TEST_LOG_COLUMNS = (
+    "run_id", "test_case_id", "type", "browser", "test_package", "test_name",
+    "client_id", "user_role", "user_name", "pid", "worker",
+    "status", "message", "current_url", "time_taken_ms", "comment",
+)
+
+# UPDATE ... RETURNING needs SQLite >= 3.35
+_SQLITE_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+_LOG_RUN_ID_I = TEST_LOG_COLUMNS.index("run_id")
+_LOG_MESSAGE_I = TEST_LOG_COLUMNS.index("message")
+
+_INSERT_TEST_LOG_SQL = (
+    f"INSERT INTO test_logs ({', '.join(TEST_LOG_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * len(TEST_LOG_COLUMNS))});"
+)
+
+_TOUCH_TEST_RUN_SQL = """
+    UPDATE test_runs
+    SET last_update_at = CURRENT_TIMESTAMP,
+        last_heartbeat_at = CURRENT_TIMESTAMP,
+        last_update_message = ?
+    WHERE run_id = ?;
+"""
+
+# Tables and indexes created by RTVSDB's create_* helpers; keep in sync when adding one.
+_SCHEMA_OBJECTS = frozenset({
+    "chrome_profiles", "customers", "customer_accounts", "test_packages", "tester_info",
+    "test_runs", "test_logs",
+    "idx_customer_accounts_customer",
+    "idx_test_runs_run_id", "idx_test_runs_status", "idx_test_runs_started_at",
+    "idx_test_logs_run_id", "idx_test_logs_run_id_ts", "idx_test_logs_run_id_test",
+})
+
+# Statements the controller GUI runs on every click/refresh. Kept as module constants so the
+# text is identical on each call and sqlite3's per-connection statement cache reuses the
+# prepared statement instead of re-parsing it.
+_STAMP_MFA_SQL = """
+    UPDATE chrome_profiles
+    SET last_mfa_time = COALESCE(?, CURRENT_TIMESTAMP)
+    WHERE profile_name = ?;
+"""
+
+_CLAIM_INACTIVE_PROFILE_SQL = """
+    UPDATE chrome_profiles
+    SET is_active = 1,
+        currently_running = ?
+    WHERE id = (
+        SELECT id
+        FROM chrome_profiles
+        WHERE is_active = 0
+        ORDER BY id ASC
+        LIMIT 1
+    )
+    RETURNING profile_name;
+"""
+
+_SELECT_PACKAGES_BY_CATEGORY_SQL = """
+    SELECT test_package_name, test_package_desc
+    FROM test_packages
+    WHERE test_package_category = ?;
+"""
+
+_UPDATE_ROLE_USERNAME_SQL = """
+    UPDATE customer_accounts
+    SET username = ?, updated_at = CURRENT_TIMESTAMP
+    WHERE customer_id = ? AND role = ?;
+"""
+
+_SELECT_CLIENTS_SQL = "SELECT customer_id, customer_name FROM customers ORDER BY customer_id ASC;"
+_SELECT_ROLES_SQL = "SELECT DISTINCT role FROM customer_accounts ORDER BY role ASC;"
+
 
 def find_assets_dir() -> Path:
     """
@@ -59,27 +134,65 @@ class RTVSDB:
         # db_path.parent.mkdir(parents=True, exist_ok=True)
         self.db_path = Path(db_path).resolve() if db_path else self.DEFAULT_DB_PATH
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
-        self.connection = sqlite3.connect(str(self.db_path), timeout=5, check_same_thread=True)
+        self.connection = sqlite3.connect(str(self.db_path), timeout=5, check_same_thread=True,
+                                          cached_statements=256)
         self.cursor = self.connection.cursor()
         self.connection.execute('PRAGMA foreign_keys = ON;')
         self.connection.execute("PRAGMA journal_mode=WAL;")
         self.connection.execute("PRAGMA synchronous = NORMAL;")
         self.connection.execute("PRAGMA busy_timeout = 30000;")
-
-        # Initialize tables
-        self.create_chrome_profile_info_table()
-        self.create_customer_tables()
-        self.create_run_and_log_tables()
-        self.create_test_package_table()
-        self.create_tester_info_table()
-
-        # Commit any initial changes
-        self.connection.commit()
+        self.connection.execute("PRAGMA temp_store = MEMORY;")
+        self.connection.execute("PRAGMA mmap_size = 67108864;")  # 64 MB: hot pages read without syscalls
+        self.connection.execute("PRAGMA cache_size = -20000;")  # ~20 MB page cache per connection
+        self._tx_depth = 0
+
+        # Initialize tables (one transaction). Skipped when the schema is already there so
+        # opening an existing DB does not take the write lock.
+        if not self._schema_ready():
+            with self.transaction():
+                self.create_chrome_profile_info_table()
+                self.create_customer_tables()
+                self.create_run_and_log_tables()
+                self.create_test_package_table()
+                self.create_tester_info_table()
 
     @property
     def _db_path(self) -> Path:
         return self.db_path
 
+    @contextmanager
+    def transaction(self):
+        """
+        Run a group of writes as one transaction (one commit).
+        Nested calls, including the write helpers below, join the outermost transaction.
+        """
+        if self._tx_depth:
+            self._tx_depth += 1
+            try:
+                yield self.connection
+            finally:
+                self._tx_depth -= 1
+            return
+
+        self.connection.execute("BEGIN IMMEDIATE;")
+        self._tx_depth = 1
+        try:
+            yield self.connection
+        except BaseException:
+            self.connection.rollback()
+            raise
+        else:
+            self.connection.commit()
+        finally:
+            self._tx_depth = 0
+
+    def _schema_ready(self) -> bool:
+        """True if every table and index the create_* helpers make already exists."""
+        cursor = self.connection.execute(
+            "SELECT name FROM sqlite_master WHERE type IN ('table', 'index');"
+        )
+        return _SCHEMA_OBJECTS <= {row[0] for row in cursor.fetchall()}
+
     def check_if_table_exists(self, table_name):
         """Check if a table exists in the database."""
         cursor = self.connection.cursor()
@@ -91,7 +204,7 @@ class RTVSDB:
     def create_table(self, table_name, columns):
         """Create a table with the specified columns."""
         columns_with_types = ', '.join([f"{col} {dtype}" for col, dtype in columns.items()])
-        with self.connection:
+        with self.transaction():
             cursor = self.connection.cursor()
             cursor.execute(f"""
                 CREATE TABLE IF NOT EXISTS {table_name} ({columns_with_types});
@@ -99,7 +212,7 @@ class RTVSDB:
 
     def run_query(self, query, params=()):
         """Run a custom query with optional parameters."""
-        with self.connection:
+        with self.transaction():
             cursor = self.connection.cursor()
             cursor.execute(query, params)
             return cursor.fetchall()
@@ -110,7 +223,7 @@ class RTVSDB:
 
     # DB functions for the tester_info table
     def create_tester_info_table(self):
-        with self.connection:
+        with self.transaction():
             cursor = self.connection.cursor()
             cursor.execute("""
             CREATE TABLE IF NOT EXISTS tester_info (
@@ -126,13 +239,13 @@ class RTVSDB:
 
     def clear_tester_info_table(self):
         """Delete all records from tester_info table."""
-        with self.connection:
+        with self.transaction():
             cursor = self.connection.cursor()
             cursor.execute("DELETE FROM tester_info;")
 
     def insert_tester_info(self, username: str, password: str, email: str, reason: str, signature: str):
         """Insert a new tester info into the database."""
-        with self.connection:
+        with self.transaction():
             cursor = self.connection.cursor()
             cursor.execute("""
                 INSERT INTO tester_info (username, password, email, reason_for_login, signature)
@@ -183,7 +296,7 @@ class RTVSDB:
 
     # DB functions for the master test package table
     def create_test_package_table(self):
-        with self.connection:
+        with self.transaction():
             cursor = self.connection.cursor()
             cursor.execute("""
             CREATE TABLE IF NOT EXISTS test_packages (
@@ -218,8 +331,9 @@ class RTVSDB:
 
         ]
 
-        for tp in test_packages_dict_list:
-            self.insert_test_package(tp["name"], tp["category"], tp["desc"], tp["available_to"])
+        with self.transaction():
+            for tp in test_packages_dict_list:
+                self.insert_test_package(tp["name"], tp["category"], tp["desc"], tp["available_to"])
 
     def fetch_regression_test_packages(self):
         """Fetch all test packages categorized as 'REG'."""
@@ -241,6 +355,12 @@ class RTVSDB:
         """)
         return [tp[0] for tp in cursor.fetchall()]
 
+    def fetch_test_packages_with_descriptions(self, category: str) -> dict[str, str]:
+        """Fetch {test_package_name: test_package_desc} for one category (e.g. 'REG', 'DATA')."""
+        cursor = self.connection.cursor()
+        cursor.execute(_SELECT_PACKAGES_BY_CATEGORY_SQL, (category,))
+        return {name: desc or "" for name, desc in cursor.fetchall()}
+
     def fetch_test_package_description(self, name: str) -> str | None:
         """Fetch the description of a test package by name."""
         cursor = self.connection.cursor()
@@ -260,7 +380,7 @@ class RTVSDB:
             desc: Description of the test package
             available_to: Who the test package is available to (e.g., 'ALL', 'CS', 'RS', 'LCS', 'CU', 'OAPD', 'ALL_VIEW')
         """
-        with self.connection:
+        with self.transaction():
             cursor = self.connection.cursor()
             cursor.execute("""
                 INSERT INTO test_packages (test_package_name, test_package_category, test_package_desc, available_to)
@@ -295,7 +415,7 @@ class RTVSDB:
 
         profiles = [(f"{name_prefix}{i}", "Not running, MFA Expired", 0) for i in range(1, profile_count + 1)]
 
-        with self.connection:
+        with self.transaction():
             cursor = self.connection.cursor()
             cursor.executemany(
                 """
@@ -326,7 +446,7 @@ class RTVSDB:
         """
         if change_type == 'UPDATE_MFA_TIME' and profile_name:
             print(f"Updating MFA time for profile {profile_name} to {timestamp}.")
-            with self.connection:
+            with self.transaction():
                 cursor = self.connection.cursor()
                 cursor.execute("""
                     UPDATE chrome_profiles
@@ -336,7 +456,7 @@ class RTVSDB:
         if change_type == 'SET_ACTIVE_PROFILE' and profile_name:
             # this will look for profile name and set its only its is active to 1.
             # print(f"Setting profile {profile_name} as active.")
-            with self.connection:
+            with self.transaction():
                 cursor = self.connection.cursor()
                 cursor.execute("""
                     UPDATE chrome_profiles
@@ -346,7 +466,7 @@ class RTVSDB:
         if change_type == 'SET_INACTIVE_PROFILE' and profile_name:
             # this will look for profile name and set its only its is active to 0.
             # print(f"Setting profile {profile_name} as inactive.")
-            with self.connection:
+            with self.transaction():
                 cursor = self.connection.cursor()
                 cursor.execute("""
                     UPDATE chrome_profiles
@@ -354,6 +474,17 @@ class RTVSDB:
                     WHERE profile_name = ?;
                 """, (profile_name,))
 
+    def stamp_mfa_times(self, profile_names: list[str], timestamp: str | None = None) -> None:
+        """
+        Set last_mfa_time for several profiles in one transaction.
+        timestamp: 'YYYY-MM-DD HH:MM:SS', or None for CURRENT_TIMESTAMP.
+        """
+        with self.transaction():
+            self.connection.executemany(
+                _STAMP_MFA_SQL,
+                [(timestamp, name) for name in profile_names],
+            )
+
     def get_inactive_chrome_profiles(self):
         """Fetch and return all inactive Chrome profiles."""
         cursor = self.connection.cursor()
@@ -377,63 +508,47 @@ class RTVSDB:
             # Grab the write lock early so two workers can't claim at once
             cur.execute("BEGIN IMMEDIATE;")
 
-            # Prefer single-statement claim if SQLite supports RETURNING (SQLite >= 3.35)
-            try:
-                cur.execute(
-                    """
-                    UPDATE chrome_profiles
-                    SET is_active = 1,
-                        currently_running = ?
-                    WHERE id = (
-                        SELECT id
-                        FROM chrome_profiles
-                        WHERE is_active = 0
-                        ORDER BY id ASC
-                        LIMIT 1
-                    )
-                    RETURNING profile_name;
-                    """,
-                    (claimed_by,),
-                )
+            # Single-statement claim when SQLite supports RETURNING (checked once at import)
+            if _SQLITE_HAS_RETURNING:
+                cur.execute(_CLAIM_INACTIVE_PROFILE_SQL, (claimed_by,))
                 row = cur.fetchone()
                 self.connection.commit()
                 return row[0] if row else None
 
-            except sqlite3.OperationalError:
-                # Fallback for older SQLite without RETURNING:
-                cur.execute(
-                    """
-                    SELECT id, profile_name
-                    FROM chrome_profiles
-                    WHERE is_active = 0
-                    ORDER BY id ASC
-                    LIMIT 1;
-                    """
-                )
-                row = cur.fetchone()
-                if not row:
-                    self.connection.commit()
-                    return None
+            # Fallback for older SQLite without RETURNING:
+            cur.execute(
+                """
+                SELECT id, profile_name
+                FROM chrome_profiles
+                WHERE is_active = 0
+                ORDER BY id ASC
+                LIMIT 1;
+                """
+            )
+            row = cur.fetchone()
+            if not row:
+                self.connection.commit()
+                return None
 
-                profile_id, profile_name = row
+            profile_id, profile_name = row
 
-                cur.execute(
-                    """
-                    UPDATE chrome_profiles
-                    SET is_active = 1,
-                        currently_running = ?
-                    WHERE id = ? AND is_active = 0;
-                    """,
-                    (claimed_by, profile_id),
-                )
+            cur.execute(
+                """
+                UPDATE chrome_profiles
+                SET is_active = 1,
+                    currently_running = ?
+                WHERE id = ? AND is_active = 0;
+                """,
+                (claimed_by, profile_id),
+            )
 
-                # If rowcount is 0, someone else got it (should be rare with BEGIN IMMEDIATE)
-                if cur.rowcount != 1:
-                    self.connection.rollback()
-                    return None
+            # If rowcount is 0, someone else got it (should be rare with BEGIN IMMEDIATE)
+            if cur.rowcount != 1:
+                self.connection.rollback()
+                return None
 
-                self.connection.commit()
-                return profile_name
+            self.connection.commit()
+            return profile_name
 
         except Exception:
             self.connection.rollback()
@@ -441,7 +556,7 @@ class RTVSDB:
 
     # DB Functions for the Customer table
     def create_customer_tables(self):
-        with self.connection:
+        with self.transaction():
             cursor = self.connection.cursor()
             cursor.execute("""
             CREATE TABLE IF NOT EXISTS customers (
@@ -487,54 +602,48 @@ class RTVSDB:
         if not isinstance(customers, list):
             raise ValueError("JSON format error: 'customers' must be a list")
 
-        with self.connection:  # one transaction
+        # Last entry wins if a customer_id appears more than once
+        by_id: dict[int, tuple[str, list[tuple[int, str, str]]]] = {}
+        for c in customers:
+            customer_id = int(c["id"])
+            customer_name = str(c["name"]).strip()
+            by_id[customer_id] = (
+                customer_name,
+                [(customer_id, str(a["role"]).strip(), str(a["username"]).strip()) for a in c.get("accounts", [])],
+            )
+
+        with self.transaction():  # one transaction
             cursor = self.connection.cursor()
-            for c in customers:
-                customer_id = int(c["id"])
-                customer_name = str(c["name"]).strip()
-                accounts = c.get("accounts", [])
 
-                # 1) Upsert customer (portable)
-                cursor.execute(
+            # 1) Upsert customers (DO UPDATE keeps the row, so accounts aren't cascade-deleted)
+            cursor.executemany(
+                """
+                INSERT INTO customers (customer_id, customer_name, updated_at)
+                VALUES (?, ?, CURRENT_TIMESTAMP)
+                ON CONFLICT(customer_id) DO UPDATE SET
+                  customer_name = excluded.customer_name,
+                  updated_at = CURRENT_TIMESTAMP;
+                """,
+                [(customer_id, name) for customer_id, (name, _) in by_id.items()]
+            )
+
+            # 2) Overwrite roles for these customer_ids
+            cursor.executemany(
+                "DELETE FROM customer_accounts WHERE customer_id = ?;",
+                [(customer_id,) for customer_id in by_id]
+            )
+
+            # 3) Insert accounts
+            rows = [row for _, accounts in by_id.values() for row in accounts]
+            if rows:
+                cursor.executemany(
                     """
-                    UPDATE customers
-                    SET customer_name = ?, updated_at = CURRENT_TIMESTAMP
-                    WHERE customer_id = ?;
+                    INSERT INTO customer_accounts (customer_id, role, username, updated_at)
+                    VALUES (?, ?, ?, CURRENT_TIMESTAMP);
                     """,
-                    (customer_name, customer_id)
+                    rows
                 )
 
-                if cursor.rowcount == 0:
-                    cursor.execute(
-                        """
-                        INSERT INTO customers (customer_id, customer_name, updated_at)
-                        VALUES (?, ?, CURRENT_TIMESTAMP);
-                        """,
-                        (customer_id, customer_name)
-                    )
-
-                # 2) Overwrite roles for this customer_id
-                cursor.execute(
-                    "DELETE FROM customer_accounts WHERE customer_id = ?;",
-                    (customer_id,)
-                )
-
-                # 3) Insert accounts
-                rows = []
-                for a in accounts:
-                    role = str(a["role"]).strip()
-                    username = str(a["username"]).strip()
-                    rows.append((customer_id, role, username))
-
-                if rows:
-                    cursor.executemany(
-                        """
-                        INSERT INTO customer_accounts (customer_id, role, username, updated_at)
-                        VALUES (?, ?, ?, CURRENT_TIMESTAMP);
-                        """,
-                        rows
-                    )
-
     def get_role_dict_for_customer_id(self, customer_id):
         """Get all roles for a given customer ID."""
         query = ("""
@@ -608,6 +717,24 @@ class RTVSDB:
         customer_names = [row[0] for row in rows]
         return customer_names
 
+    def fetch_customers(self) -> list[tuple[int, str]]:
+        """Get all (customer_id, customer_name) pairs, sorted by customer_id."""
+        cursor = self.connection.cursor()
+        cursor.execute(_SELECT_CLIENTS_SQL)
+        return cursor.fetchall()
+
+    def fetch_clients_and_roles(self) -> tuple[list[tuple[int, str]], list[str]]:
+        """
+        Get (customer_id, customer_name) pairs and the distinct account roles
+        back-to-back on one connection, both sorted, for the Start Test dialog.
+        """
+        cursor = self.connection.cursor()
+        cursor.execute(_SELECT_CLIENTS_SQL)
+        clients = cursor.fetchall()
+        cursor.execute(_SELECT_ROLES_SQL)
+        roles = [row[0] for row in cursor.fetchall()]
+        return clients, roles
+
     def get_total_customers_count(self):
         """Get the total number of customers in the database."""
         query = "SELECT COUNT(*) FROM customers;"
@@ -621,21 +748,22 @@ class RTVSDB:
 
     def update_username_for_role(self, customer_id, role, new_username):
         """Update the username for a specific role of a customer."""
-        with self.connection:
-            cursor = self.connection.cursor()
-
-            cursor.execute("""
-                UPDATE customer_accounts
-                SET username = ?, updated_at = CURRENT_TIMESTAMP
-                WHERE customer_id = ? AND role = ?;
-            """, (new_username, customer_id, role))
+        self.update_usernames_for_roles(customer_id, [(role, new_username)])
+
+    def update_usernames_for_roles(self, customer_id, role_usernames: list[tuple[str, str]]) -> None:
+        """Update several (role, username) pairs of one customer in a single transaction."""
+        with self.transaction():
+            self.connection.executemany(
+                _UPDATE_ROLE_USERNAME_SQL,
+                [(username, customer_id, role) for role, username in role_usernames],
+            )
 
     # DB Functions for the Test Runs and Test Logs Tables
     def create_run_and_log_tables(self):
-        with self.connection:
+        with self.transaction():
             cursor = self.connection.cursor()
 
-            cursor.executescript("""
+            cursor.execute("""
             CREATE TABLE IF NOT EXISTS test_runs (
               id INTEGER PRIMARY KEY AUTOINCREMENT,
               run_id TEXT NOT NULL UNIQUE,
@@ -659,10 +787,13 @@ class RTVSDB:
               unique_id TEXT NOT NULL,
               other_info_json TEXT
             );
+            """)
 
-            CREATE INDEX IF NOT EXISTS idx_test_runs_run_id ON test_runs(run_id);
-            CREATE INDEX IF NOT EXISTS idx_test_runs_status ON test_runs(status);
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_test_runs_run_id ON test_runs(run_id);")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_test_runs_status ON test_runs(status);")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_test_runs_started_at ON test_runs(started_at DESC);")
 
+            cursor.execute("""
             CREATE TABLE IF NOT EXISTS test_logs (
               id INTEGER PRIMARY KEY AUTOINCREMENT,
               run_id TEXT NOT NULL,
@@ -684,16 +815,16 @@ class RTVSDB:
               current_url TEXT,
               FOREIGN KEY (run_id) REFERENCES test_runs(run_id) ON DELETE CASCADE
             );
-
-            CREATE INDEX IF NOT EXISTS idx_test_logs_run_id ON test_logs(run_id);
-            CREATE INDEX IF NOT EXISTS idx_test_logs_run_id_ts ON test_logs(run_id, timestamp);
-            CREATE INDEX IF NOT EXISTS idx_test_logs_run_id_test ON test_logs(run_id, test_name);
             """)
 
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_test_logs_run_id ON test_logs(run_id);")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_test_logs_run_id_ts ON test_logs(run_id, timestamp);")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_test_logs_run_id_test ON test_logs(run_id, test_name);")
+
     def insert_test_run(self, rc) -> None: # controller will call this function
         other = json.dumps(rc.other_info or {}, ensure_ascii=False)
 
-        with self.connection:
+        with self.transaction():
             cursor = self.connection.cursor()
 
             cursor.execute(
@@ -766,37 +897,33 @@ class RTVSDB:
             time_taken_ms: int | None = None,
             comment: str | None = None
     ):
-        with self.connection:
-            cursor = self.connection.cursor()
+        """Insert one test_logs row. Hot paths should batch tuples via insert_test_logs_many."""
+        self.insert_test_logs_many([(
+            run_id, test_case_id, type_, browser, test_package, test_name,
+            client_id, user_role, user_name, pid, worker,
+            status, message, current_url, time_taken_ms, comment
+        )])
+
+    def insert_test_logs_many(self, rows: list[tuple]) -> None:
+        """
+        Insert a batch of test_logs rows in one transaction.
+        rows: tuples in TEST_LOG_COLUMNS order.
+        Each run in the batch gets a single test_runs touch carrying its latest message.
+        """
+        if not rows:
+            return
+        latest = {row[_LOG_RUN_ID_I]: row[_LOG_MESSAGE_I] for row in rows}
 
-            cursor.execute(
-                """
-                INSERT INTO test_logs (
-                  run_id, test_case_id, type, browser, test_package, test_name,
-                  client_id, user_role, user_name, pid, worker,
-                  status, message, current_url, time_taken_ms, comment
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?);
-                """,
-                (
-                    run_id, test_case_id, type_, browser, test_package, test_name,
-                    client_id, user_role, user_name, pid, worker,
-                    status, message, current_url, time_taken_ms, comment
-                ),
-            )
-            cursor.execute(
-                """
-                UPDATE test_runs
-                SET last_update_at = CURRENT_TIMESTAMP,
-                    last_heartbeat_at = CURRENT_TIMESTAMP,
-                    last_update_message = ?
-                WHERE run_id = ?;
-                """,
-                (message[:250], run_id),
+        with self.transaction():
+            cursor = self.connection.cursor()
+            cursor.executemany(_INSERT_TEST_LOG_SQL, rows)
+            cursor.executemany(
+                _TOUCH_TEST_RUN_SQL,
+                [((message or "")[:250], run_id) for run_id, message in latest.items()],
             )
 
     def mark_test_failure(self, run_id: str, message: str = "Test failed"):
-        with self.connection:
+        with self.transaction():
             cursor = self.connection.cursor()
 
             cursor.execute(
@@ -815,7 +942,7 @@ class RTVSDB:
             )
 
     def finish_run(self, run_id: str, final_status: str):
-        with self.connection:
+        with self.transaction():
             cursor = self.connection.cursor()
 
             cursor.execute(
@@ -99,7 +99,10 @@ def config_assists():
     ca = ConfigAssists()
     # ca.create_first_time_setup()
     yield ca
-    ca.db.close()
+    try:
+        ca.flush_logs()
+    finally:
+        ca.db.close()
 
 @pytest.fixture(scope="session", autouse=True)
 def init_session_state(pytestconfig, config_assists):
@@ -153,8 +153,7 @@ def run_lane_serial(
     time.sleep(0.75 * (lane_id - 1))
 
     for j in jobs:
-        env = base_env.copy()    # USE base_env, not os.environ.copy()
-        env["BROWSER"] = j.browser
+        env = {**base_env, "BROWSER": j.browser}    # USE base_env, not os.environ.copy()
 
         external = _pick_external_python()
 
@@ -175,9 +174,14 @@ def run_lane_serial(
             str(Path(Config.RTVS_PROJECT_ROOT / "tests")),
         ]
 
-        print(f"\n[RTVS] Lane {lane_id} running job:")
-        print(f"  client={j.client_id} role={j.user_role} browser={j.browser}")
-        print(" ", " ".join(cmd))
+        # one print per job so lines from parallel lanes don't interleave
+        # (print, not sys.stdout.write: stdout is None in the windowed exe)
+        print(
+            f"\n[RTVS] Lane {lane_id} running job:\n"
+            f"  client={j.client_id} role={j.user_role} browser={j.browser}\n"
+            f"  {' '.join(cmd)}",
+            flush=True,
+        )
 
         creationflags = 0
         if os.name == "nt":
@@ -187,6 +191,7 @@ def run_lane_serial(
             cmd,
             env=env,
             cwd=str(Config.RTVS_PROJECT_ROOT),
+            stdin=subprocess.DEVNULL,  # lanes are non-interactive; don't inherit the GUI's stdin
             capture_output=True,
             text=True,
             creationflags=creationflags,